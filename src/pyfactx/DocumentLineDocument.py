@@ -6,7 +6,7 @@ from typing_extensions import override
 from .InvoiceProfile import InvoiceProfile
 from .Note import Note
 from .XMLBaseModel import XMLBaseModel
-from .namespaces import NAMESPACES, RAM
+from .namespaces import NAMESPACES, RAM, get_qualified_name
 
 
 class DocumentLineDocument(XMLBaseModel):
@@ -105,7 +105,7 @@ class DocumentLineDocument(XMLBaseModel):
             ValueError: If XML creation fails.
         """
         try:
-            root = ET.Element(f"{{{NAMESPACES[RAM]}}}{element_name}")
+            root = ET.Element(get_qualified_name(RAM, element_name))
 
             # LineID - convert to string and ensure it's properly formatted
             line_id_element = ET.SubElement(root, f"{{{NAMESPACES[RAM]}}}LineID")
@@ -7,7 +7,7 @@ import re
 from .InvoiceProfile import InvoiceProfile
 from .InvoiceTypeCode import InvoiceTypeCode
 from .Note import Note
-from .XMLBaseModel import XMLBaseModel
+from .XMLBaseModel import XMLBaseModel, format_date_102
 from .namespaces import NAMESPACES, RAM, RSM, UDT
 
 
@@ -192,12 +192,11 @@ class ExchangedDocument(XMLBaseModel):
                 f"{{{NAMESPACES[UDT]}}}DateTimeString",
                 attrib={"format": "102"}
             )
-            date_element.text = self.issue_date_time.strftime("%Y%m%d")
+            date_element.text = format_date_102(self.issue_date_time)
 
             # IncludedNotes - only for BASICWL profile and higher
             if profile >= InvoiceProfile.BASICWL and self.included_notes:
-                for note in self.included_notes:
-                    root.append(note.to_xml("IncludedNote", profile))
+                root.extend([note.to_xml("IncludedNote", profile) for note in self.included_notes])
 
             return root
 
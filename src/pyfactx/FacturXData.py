@@ -1,4 +1,4 @@
-from typing import Optional, ClassVar
+from typing import Optional, ClassVar, BinaryIO
 from lxml import etree as ET
 from pydantic import Field, ConfigDict, model_validator
 from typing_extensions import override
@@ -10,7 +10,6 @@ from .SupplyChainTradeTransaction import SupplyChainTradeTransaction
 from .XMLBaseModel import XMLBaseModel
 from .namespaces import NAMESPACES, RSM
 
-
 class FacturXData(XMLBaseModel):
     """Represents the root structure of a Factur-X XML invoice document.
 
@@ -112,6 +111,33 @@ class FacturXData(XMLBaseModel):
         except (ET.XMLSyntaxError, ValueError) as e:
             raise ValueError(f"Failed to create XML document: {str(e)}")
 
+    def to_xml_bytes(self, profile: InvoiceProfile) -> bytes:
+        """Serializes the invoice to compact UTF-8 XML.
+
+        Shorthand for ``ET.tostring(self.to_xml(ROOT_ELEMENT, profile), encoding="UTF-8")``.
+
+        Args:
+            profile (InvoiceProfile): The Factur-X profile being used.
+
+        Returns:
+            bytes: The serialized invoice document.
+        """
+        return ET.tostring(self.to_xml(self.ROOT_ELEMENT, profile), encoding="UTF-8")
+
+    def write_xml(self, stream: BinaryIO, profile: InvoiceProfile) -> None:
+        """Writes the invoice as compact UTF-8 XML to a binary stream.
+
+        The document is built with to_xml and serialized in one piece with
+        ``ET.tostring`` before being written, so this does not stream
+        incrementally; it only saves callers the intermediate bytes handling.
+
+        Args:
+            stream (BinaryIO): Writable binary stream, e.g. a BytesIO or a file
+                opened in binary mode.
+            profile (InvoiceProfile): The Factur-X profile being used.
+        """
+        stream.write(ET.tostring(self.to_xml(self.ROOT_ELEMENT, profile), encoding="UTF-8"))
+
     def get_invoice_number(self) -> str:
         """Returns the invoice number from the exchanged document.
 
@@ -1,7 +1,8 @@
 import logging
 import tempfile
+from dataclasses import dataclass
 from pathlib import Path
-from typing import ClassVar
+from typing import ClassVar, Iterable
 
 from lxml import etree as ET
 from saxonche import PySaxonProcessor
@@ -12,6 +13,7 @@ from .InvoiceProfile import InvoiceProfile
 
 class SchematronValidationError(Exception):
     """Exception raised when Schematron validation fails."""
+
     def __init__(self, failed_asserts: list[str], reports: list[str]):
         self.failed_asserts = failed_asserts
         self.reports = reports
@@ -19,14 +21,12 @@ class SchematronValidationError(Exception):
         super().__init__(message)
 
     def _format_message(self) -> str:
-        messages = []
+        parts = []
         if self.failed_asserts:
-            messages.append("Failed assertions:")
-            messages.extend(f"  - {assertion}" for assertion in self.failed_asserts)
+            parts.append("Failed assertions:\n" + "\n".join(f"  - {assertion}" for assertion in self.failed_asserts))
         if self.reports:
-            messages.append("Validation reports:")
-            messages.extend(f"  - {report}" for report in self.reports)
-        return "\n".join(messages)
+            parts.append("Validation reports:\n" + "\n".join(f"  - {report}" for report in self.reports))
+        return "\n".join(parts)
 
 
 class FacturXGenerator:
@@ -55,7 +55,8 @@ class FacturXGenerator:
         cls,
         factur_x_data: FacturXData,
         profile: InvoiceProfile,
-        validate_xslt: bool = True
+        validate_xslt: bool = True,
+        strict_profile: bool = False
     ) -> ET.Element:
         """Generates and optionally validates a Factur-X XML document.
 
@@ -64,6 +65,8 @@ class FacturXGenerator:
             profile (InvoiceProfile): The target profile for generation.
             validate_xslt (bool, optional): Whether to perform Schematron validation.
                 Defaults to True.
+            strict_profile (bool, optional): Whether to reject fields the profile does
+                not allow instead of leaving them out of the XML. Defaults to False.
 
         Returns:
             ET.Element: The generated XML document.
@@ -72,12 +75,16 @@ class FacturXGenerator:
             NotImplementedError: If the EXTENDED profile is requested.
             FileNotFoundError: If the XSLT file for validation is not found.
             SchematronValidationError: If the generated XML fails validation.
-            ValueError: If XML generation fails.
+            ValueError: If XML generation fails, or strict_profile is set and a
+                transaction field is not allowed in the profile.
         """
         if profile == InvoiceProfile.EXTENDED:
             logging.error("The 'EXTENDED' profile is not implemented")
             raise NotImplementedError("The 'EXTENDED' profile is not supported yet")
 
+        if strict_profile:
+            factur_x_data.supply_chain_transaction.validate_for(profile)
+
         try:
             # Generate XML
             factur_x_xml = factur_x_data.to_xml("CrossIndustryInvoice", profile)
@@ -91,6 +98,55 @@ class FacturXGenerator:
         except ET.XMLSyntaxError as e:
             raise ValueError(f"Failed to generate XML: {str(e)}")
 
+    @classmethod
+    def generate_many(
+        cls,
+        invoices: Iterable[FacturXData],
+        profile: InvoiceProfile,
+        validate_xslt: bool = True,
+        strict_profile: bool = False
+    ) -> list[ET.Element]:
+        """Generates and optionally validates a batch of Factur-X XML documents.
+
+        Equivalent to calling generate for each invoice, but the Schematron
+        stylesheet is compiled once and reused for the whole batch.
+
+        Args:
+            invoices (Iterable[FacturXData]): The Factur-X data to generate XML from.
+            profile (InvoiceProfile): The target profile for generation.
+            validate_xslt (bool, optional): Whether to perform Schematron validation.
+                Defaults to True.
+            strict_profile (bool, optional): Whether to reject fields the profile does
+                not allow instead of leaving them out of the XML. Defaults to False.
+
+        Returns:
+            list[ET.Element]: The generated XML documents, in input order.
+
+        Raises:
+            NotImplementedError: If the EXTENDED profile is requested.
+            FileNotFoundError: If the XSLT file for validation is not found.
+            SchematronValidationError: If a generated XML document fails validation.
+            ValueError: If XML generation fails, or strict_profile is set and a
+                transaction field is not allowed in the profile.
+        """
+        if profile == InvoiceProfile.EXTENDED:
+            logging.error("The 'EXTENDED' profile is not implemented")
+            raise NotImplementedError("The 'EXTENDED' profile is not supported yet")
+
+        if not validate_xslt:
+            return [cls.generate(invoice, profile, validate_xslt=False, strict_profile=strict_profile)
+                    for invoice in invoices]
+
+        with PySaxonProcessor(license=False) as proc:
+            xslt = cls._compile_stylesheet(proc, profile)
+            results = []
+            for invoice in invoices:
+                factur_x_xml = cls.generate(invoice, profile, validate_xslt=False,
+                                            strict_profile=strict_profile)
+                cls._run_schematron(xslt, factur_x_xml)
+                results.append(factur_x_xml)
+            return results
+
     @classmethod
     def _validate_with_schematron(cls, xml: ET.Element, profile: InvoiceProfile) -> None:
         """Validates XML against Schematron rules using XSLT.
@@ -103,6 +159,47 @@ class FacturXGenerator:
             FileNotFoundError: If the XSLT file is not found.
             SchematronValidationError: If validation fails.
         """
+        with PySaxonProcessor(license=False) as proc:
+            xslt = cls._compile_stylesheet(proc, profile)
+            cls._run_schematron(xslt, xml)
+
+    @classmethod
+    def _compile_stylesheet(cls, proc: PySaxonProcessor, profile: InvoiceProfile):
+        """Compiles the Schematron XSLT stylesheet for a profile.
+
+        Args:
+            proc (PySaxonProcessor): The Saxon processor to compile with.
+            profile (InvoiceProfile): The profile to use for validation.
+
+        Returns:
+            The compiled XSLT executable.
+
+        Raises:
+            FileNotFoundError: If the XSLT file is not found.
+        """
+        # Get XSLT path
+        stylesheet_path = Path(cls.XSLT_LOCATIONS[profile]).resolve()
+        if not stylesheet_path.exists():
+            raise FileNotFoundError(
+                f"XSLT file not found: {stylesheet_path}"
+            )
+
+        xslt_proc = proc.new_xslt30_processor()
+        return xslt_proc.compile_stylesheet(
+            stylesheet_file=str(stylesheet_path)
+        )
+
+    @classmethod
+    def _run_schematron(cls, xslt, xml: ET.Element) -> None:
+        """Runs a compiled Schematron stylesheet against an XML document.
+
+        Args:
+            xslt: The compiled XSLT executable.
+            xml (ET.Element): The XML document to validate.
+
+        Raises:
+            SchematronValidationError: If validation fails.
+        """
         # Write XML to temporary file
         with tempfile.NamedTemporaryFile(
             mode="w+",
@@ -119,20 +216,8 @@ class FacturXGenerator:
             xml_path = xml_file.name
 
         try:
-            # Get XSLT path
-            stylesheet_path = Path(cls.XSLT_LOCATIONS[profile]).resolve()
-            if not stylesheet_path.exists():
-                raise FileNotFoundError(
-                    f"XSLT file not found: {stylesheet_path}"
-                )
-
             # Perform XSLT transformation
-            with PySaxonProcessor(license=False) as proc:
-                xslt_proc = proc.new_xslt30_processor()
-                xslt = xslt_proc.compile_stylesheet(
-                    stylesheet_file=str(stylesheet_path)
-                )
-                result = xslt.transform_to_string(source_file=xml_path)
+            result = xslt.transform_to_string(source_file=xml_path)
 
             # Parse validation results
             validation_result = cls._parse_svrl_result(result)
@@ -179,6 +264,7 @@ class FacturXGenerator:
         )
 
 
+@dataclass(frozen=True, slots=True)
 class ValidationResult:
     """Container for Schematron validation results.
 
@@ -188,12 +274,6 @@ class ValidationResult:
         reports (list[str]): List of validation reports.
     """
 
-    def __init__(
-        self,
-        is_valid: bool,
-        failed_asserts: list[str],
-        reports: list[str]
-    ):
-        self.is_valid = is_valid
-        self.failed_asserts = failed_asserts
-        self.reports = reports
\ No newline at end of file
+    is_valid: bool
+    failed_asserts: list[str]
+    reports: list[str]
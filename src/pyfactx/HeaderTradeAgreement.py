@@ -8,7 +8,9 @@ from .ProcuringProject import ProcuringProject
 from .ReferencedDocument import ReferencedDocument
 from .TradeParty import TradeParty
 from .XMLBaseModel import XMLBaseModel
-from .namespaces import NAMESPACES, RAM
+from .namespaces import RAM, get_qualified_name
+
+_TAG_BUYER_REFERENCE = get_qualified_name(RAM, "BuyerReference")
 
 
 class HeaderTradeAgreement(XMLBaseModel):
@@ -75,11 +77,11 @@ class HeaderTradeAgreement(XMLBaseModel):
         Returns:
             ET.Element: The XML element containing the trade agreement data
         """
-        root = ET.Element(f"{{{NAMESPACES[RAM]}}}{element_name}")
+        root = ET.Element(get_qualified_name(RAM, element_name))
 
         # BuyerReference (optional)
         if self.buyer_reference:
-            buyer_ref = ET.SubElement(root, f"{{{NAMESPACES[RAM]}}}BuyerReference")
+            buyer_ref = ET.SubElement(root, _TAG_BUYER_REFERENCE)
             buyer_ref.text = self.buyer_reference
 
         # SellerTradeParty (required)
@@ -124,9 +126,10 @@ class HeaderTradeAgreement(XMLBaseModel):
 
         # AdditionalReferencedDocument (optional, EN16931 and above)
         if profile >= InvoiceProfile.EN16931 and self.additional_referenced_documents:
-            for doc in self.additional_referenced_documents:
-                additional = doc.to_xml("AdditionalReferencedDocument", profile)
-                root.append(additional)
+            root.extend([
+                doc.to_xml("AdditionalReferencedDocument", profile)
+                for doc in self.additional_referenced_documents
+            ])
 
         # SpecifiedProcuringProject (optional, EN16931 and above)
         if profile >= InvoiceProfile.EN16931 and self.specified_procuring_project:
@@ -1,6 +1,8 @@
-from typing import Optional, ClassVar
+import sys
+from operator import attrgetter
+from typing import Optional
 from lxml import etree as ET
-from pydantic import Field, ConfigDict, model_validator
+from pydantic import Field, ConfigDict
 from typing_extensions import override
 
 from .InvoiceProfile import InvoiceProfile
@@ -8,7 +10,34 @@ from .ReferencedDocument import ReferencedDocument
 from .SupplyChainEvent import SupplyChainEvent
 from .TradeParty import TradeParty
 from .XMLBaseModel import XMLBaseModel
-from .namespaces import NAMESPACES, RAM
+from .namespaces import RAM, get_qualified_name
+
+# XML element names
+_EL_SHIP_TO = sys.intern("ShipToTradeParty")
+_EL_DELIVERY_EVENT = sys.intern("ActualDeliverySupplyChainEvent")
+_EL_DESPATCH = sys.intern("DespatchAdviceReferencedDocument")
+_EL_RECEIVING = sys.intern("ReceivingAdviceReferencedDocument")
+
+# (field getter, element name) pairs emitted for BASICWL and above, in XML order
+_BASICWL_PLAN = (
+    (attrgetter('ship_to_trade_party'), _EL_SHIP_TO),
+    (attrgetter('actual_delivery_supply_chain_event'), _EL_DELIVERY_EVENT),
+    (attrgetter('despatch_advice_referenced_document'), _EL_DESPATCH),
+)
+# EN16931 and above additionally carry the receiving advice
+_EN16931_PLAN = _BASICWL_PLAN + (
+    (attrgetter('receiving_advice_referenced_document'), _EL_RECEIVING),
+)
+
+# Children to emit for each profile, resolved once at import
+_EMIT_PLANS = {
+    profile: (
+        _EN16931_PLAN if profile >= InvoiceProfile.EN16931
+        else _BASICWL_PLAN if profile >= InvoiceProfile.BASICWL
+        else ()
+    )
+    for profile in InvoiceProfile
+}
 
 
 class HeaderTradeDelivery(XMLBaseModel):
@@ -26,17 +55,9 @@ class HeaderTradeDelivery(XMLBaseModel):
 
     model_config = ConfigDict(
         arbitrary_types_allowed=True,
-        validate_assignment=True
+        validate_assignment=False
     )
 
-    # XML element names as constants
-    XML_ELEMENTS: ClassVar[dict[str, str]] = {
-        'ship_to': 'ShipToTradeParty',
-        'delivery_event': 'ActualDeliverySupplyChainEvent',
-        'despatch_advice': 'DespatchAdviceReferencedDocument',
-        'receiving_advice': 'ReceivingAdviceReferencedDocument'
-    }
-
     ship_to_trade_party: Optional[TradeParty] = Field(
         default=None,
         description="Trading partner where goods are delivered (BASICWL and above)"
@@ -57,20 +78,18 @@ class HeaderTradeDelivery(XMLBaseModel):
         description="Reference to receiving advice document (EN16931 and above)"
     )
 
-    @model_validator(mode='after')
-    def validate_profile_specific_fields(self) -> 'HeaderTradeDelivery':
-        """Validates that fields are appropriate for their profile level.
+    def validate_for(self, profile: InvoiceProfile) -> None:
+        """Validates that the populated fields are allowed in the given profile.
 
-        Returns:
-            HeaderTradeDelivery: The validated instance
+        to_xml leaves out fields above the target profile; call this first to
+        reject them instead.
+
+        Args:
+            profile: The Factur-X profile the delivery will be serialized for
 
         Raises:
             ValueError: If fields are used with inappropriate profile levels
         """
-        profile = getattr(self, '_current_profile', None)
-        if not profile:
-            return self
-
         if profile < InvoiceProfile.BASICWL:
             if any([
                 self.ship_to_trade_party,
@@ -89,28 +108,6 @@ class HeaderTradeDelivery(XMLBaseModel):
                     "and above"
                 )
 
-        return self
-
-    def _append_element_if_valid(
-        self,
-        root: ET.Element,
-        field_value: Optional[XMLBaseModel],
-        element_name: str,
-        profile: InvoiceProfile,
-        min_profile: InvoiceProfile
-    ) -> None:
-        """Helper method to append XML elements based on profile requirements.
-
-        Args:
-            root: The root element to append to
-            field_value: The value to append
-            element_name: The name of the XML element
-            profile: Current profile
-            min_profile: Minimum required profile
-        """
-        if field_value is not None and profile >= min_profile:
-            root.append(field_value.to_xml(element_name, profile))
-
     @override
     def to_xml(self, element_name: str, profile: InvoiceProfile) -> ET.Element:
         """Converts the trade delivery to XML format.
@@ -122,44 +119,12 @@ class HeaderTradeDelivery(XMLBaseModel):
         Returns:
             ET.Element: The XML element containing the trade delivery data
         """
-        root = ET.Element(f"{{{NAMESPACES[RAM]}}}{element_name}")
-
-        # Set profile for validation
-        self._current_profile = profile
-
-        # BASICWL and above elements
-        self._append_element_if_valid(
-            root,
-            self.ship_to_trade_party,
-            self.XML_ELEMENTS['ship_to'],
-            profile,
-            InvoiceProfile.BASICWL
-        )
-
-        self._append_element_if_valid(
-            root,
-            self.actual_delivery_supply_chain_event,
-            self.XML_ELEMENTS['delivery_event'],
-            profile,
-            InvoiceProfile.BASICWL
-        )
-
-        self._append_element_if_valid(
-            root,
-            self.despatch_advice_referenced_document,
-            self.XML_ELEMENTS['despatch_advice'],
-            profile,
-            InvoiceProfile.BASICWL
-        )
-
-        # EN16931 and above elements
-        self._append_element_if_valid(
-            root,
-            self.receiving_advice_referenced_document,
-            self.XML_ELEMENTS['receiving_advice'],
-            profile,
-            InvoiceProfile.EN16931
-        )
+        root = ET.Element(get_qualified_name(RAM, element_name))
+
+        for get_value, child_name in _EMIT_PLANS[profile]:
+            value = get_value(self)
+            if value is not None:
+                root.append(value.to_xml(child_name, profile))
 
         return root
 
@@ -177,8 +142,12 @@ class HeaderTradeDelivery(XMLBaseModel):
 
         Returns:
             HeaderTradeDelivery: A new instance with basic delivery information
+
+        Note:
+            Both arguments are already validated model instances, so the
+            instance is built with ``model_construct`` and skips revalidation.
         """
-        return cls(
+        return cls.model_construct(
             ship_to_trade_party=ship_to,
             actual_delivery_supply_chain_event=delivery_event
         )
\ No newline at end of file
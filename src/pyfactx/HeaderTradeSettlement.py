@@ -1,6 +1,8 @@
-from typing import Optional, ClassVar, List
+import sys
+from operator import attrgetter
+from typing import Optional, List
 from lxml import etree as ET
-from pydantic import Field, ConfigDict, model_validator
+from pydantic import Field, ConfigDict
 from typing_extensions import override
 
 from .InvoiceProfile import InvoiceProfile
@@ -14,7 +16,43 @@ from .TradeSettlementHeaderMonetarySummation import TradeSettlementHeaderMonetar
 from .TradeSettlementPaymentMeans import TradeSettlementPaymentMeans
 from .TradeTax import TradeTax
 from .XMLBaseModel import XMLBaseModel
-from .namespaces import NAMESPACES, RAM
+from .namespaces import RAM, get_qualified_name
+
+# XML element names
+_EL_CREDITOR_REF = sys.intern("CreditorReferenceID")
+_EL_PAYMENT_REF = sys.intern("PaymentReference")
+_EL_TAX_CURRENCY = sys.intern("TaxCurrencyCode")
+_EL_INVOICE_CURRENCY = sys.intern("InvoiceCurrencyCode")
+_EL_PAYEE = sys.intern("PayeeTradeParty")
+_EL_PAYMENT_MEANS = sys.intern("SpecifiedTradeSettlementPaymentMeans")
+_EL_TAX = sys.intern("ApplicableTradeTax")
+_EL_PERIOD = sys.intern("BillingSpecifiedPeriod")
+_EL_ALLOWANCE = sys.intern("SpecifiedTradeAllowanceCharge")
+_EL_PAYMENT_TERMS = sys.intern("SpecifiedTradePaymentTerms")
+_EL_MONETARY_SUMMATION = sys.intern("SpecifiedTradeSettlementHeaderMonetarySummation")
+_EL_INVOICE_REF = sys.intern("InvoiceReferencedDocument")
+_EL_ACCOUNTING = sys.intern("ReceivableSpecifiedTradeAccountingAccount")
+
+# Clark-notation tags for the text elements, used by populate_element
+_TAG_CREDITOR_REF = get_qualified_name(RAM, _EL_CREDITOR_REF)
+_TAG_PAYMENT_REF = get_qualified_name(RAM, _EL_PAYMENT_REF)
+_TAG_TAX_CURRENCY = get_qualified_name(RAM, _EL_TAX_CURRENCY)
+_TAG_INVOICE_CURRENCY = get_qualified_name(RAM, _EL_INVOICE_CURRENCY)
+
+# Fields only allowed in BASICWL and above, in declaration order
+_BASICWL_FIELDS = (
+    'creditor_reference_id',
+    'payment_reference',
+    'tax_currency_code',
+    'payee_trade_party',
+    'specified_trade_settlement_payment_means',
+    'applicable_trade_tax',
+    'billing_specified_period',
+    'specified_trade_allowance_charge',
+    'specified_trade_payment_terms',
+    'invoice_referenced_documents',
+    'receivable_specified_trade_accounting_account',
+)
 
 
 class HeaderTradeSettlement(XMLBaseModel):
@@ -26,26 +64,10 @@ class HeaderTradeSettlement(XMLBaseModel):
 
     model_config = ConfigDict(
         arbitrary_types_allowed=True,
-        validate_assignment=True
+        validate_assignment=False,
+        revalidate_instances='never'
     )
 
-    # XML element names mapping
-    XML_ELEMENTS: ClassVar[dict[str, str]] = {
-        'creditor_ref': 'CreditorReferenceID',
-        'payment_ref': 'PaymentReference',
-        'tax_currency': 'TaxCurrencyCode',
-        'invoice_currency': 'InvoiceCurrencyCode',
-        'payee': 'PayeeTradeParty',
-        'payment_means': 'SpecifiedTradeSettlementPaymentMeans',
-        'tax': 'ApplicableTradeTax',
-        'period': 'BillingSpecifiedPeriod',
-        'allowance': 'SpecifiedTradeAllowanceCharge',
-        'payment_terms': 'SpecifiedTradePaymentTerms',
-        'monetary_summation': 'SpecifiedTradeSettlementHeaderMonetarySummation',
-        'invoice_ref': 'InvoiceReferencedDocument',
-        'accounting': 'ReceivableSpecifiedTradeAccountingAccount'
-    }
-
     # Required fields
     invoice_currency_code: str = Field(
         ...,
@@ -113,116 +135,91 @@ class HeaderTradeSettlement(XMLBaseModel):
         description="Accounting account details (BASICWL+)"
     )
 
-    @model_validator(mode='after')
-    def validate_profile_specific_fields(self) -> 'HeaderTradeSettlement':
-        """Validates that fields are appropriate for their profile level."""
-        profile = getattr(self, '_current_profile', None)
-        if not profile:
-            return self
-
-        if profile < InvoiceProfile.BASICWL:
-            basicwl_fields = [
-                ('creditor_reference_id', self.creditor_reference_id),
-                ('payment_reference', self.payment_reference),
-                ('tax_currency_code', self.tax_currency_code),
-                ('payee_trade_party', self.payee_trade_party),
-                ('specified_trade_settlement_payment_means', self.specified_trade_settlement_payment_means),
-                ('applicable_trade_tax', self.applicable_trade_tax),
-                ('billing_specified_period', self.billing_specified_period),
-                ('specified_trade_allowance_charge', self.specified_trade_allowance_charge),
-                ('specified_trade_payment_terms', self.specified_trade_payment_terms),
-                ('invoice_referenced_documents', self.invoice_referenced_documents),
-                ('receivable_specified_trade_accounting_account', self.receivable_specified_trade_accounting_account)
-            ]
-
-            for field_name, field_value in basicwl_fields:
-                if field_value is not None:
-                    raise ValueError(
-                        f"{field_name} is only allowed in BASICWL profile and above"
-                    )
-
-        return self
-
-    def _add_text_element(
-        self,
-        root: ET.Element,
-        value: Optional[str],
-        element_name: str,
-        profile: InvoiceProfile,
-        min_profile: InvoiceProfile
-    ) -> None:
-        """Adds a text element to the XML if conditions are met."""
-        if value is not None and profile >= min_profile:
-            ET.SubElement(root, f"{{{NAMESPACES[RAM]}}}{element_name}").text = value
-
-    def _add_object_element(
-        self,
-        root: ET.Element,
-        obj: Optional[XMLBaseModel],
-        element_name: str,
-        profile: InvoiceProfile,
-        min_profile: InvoiceProfile
-    ) -> None:
-        """Adds an object element to the XML if conditions are met."""
-        if obj is not None and profile >= min_profile:
-            root.append(obj.to_xml(element_name, profile))
-
-    def _add_list_elements(
-        self,
-        root: ET.Element,
-        items: Optional[List[XMLBaseModel]],
-        element_name: str,
-        profile: InvoiceProfile,
-        min_profile: InvoiceProfile
-    ) -> None:
-        """Adds list elements to the XML if conditions are met."""
-        if items is not None and profile >= min_profile:
-            for item in items:
-                root.append(item.to_xml(element_name, profile))
+    def validate_for(self, profile: InvoiceProfile) -> None:
+        """Validates that the populated fields are allowed in the given profile.
+
+        to_xml leaves out (BASICWL+) fields for MINIMUM; call this first to
+        reject them instead.
+
+        Args:
+            profile: The Factur-X profile the settlement will be serialized for
+
+        Raises:
+            ValueError: If a BASICWL+ field is set for a MINIMUM profile
+        """
+        if profile < InvoiceProfile.BASICWL and (
+            self.creditor_reference_id is not None
+            or self.payment_reference is not None
+            or self.tax_currency_code is not None
+            or self.payee_trade_party is not None
+            or self.specified_trade_settlement_payment_means is not None
+            or self.applicable_trade_tax is not None
+            or self.billing_specified_period is not None
+            or self.specified_trade_allowance_charge is not None
+            or self.specified_trade_payment_terms is not None
+            or self.invoice_referenced_documents is not None
+            or self.receivable_specified_trade_accounting_account is not None
+        ):
+            # Only reached on failure: find the first offending field for the message
+            field_name = next(name for name in _BASICWL_FIELDS if getattr(self, name) is not None)
+            raise ValueError(f"{field_name} is only allowed in BASICWL profile and above")
 
     @override
     def to_xml(self, element_name: str, profile: InvoiceProfile) -> ET.Element:
         """Converts the trade settlement to XML format."""
-        root = ET.Element(f"{{{NAMESPACES[RAM]}}}{element_name}")
-        
-        # Set profile for validation
-        self._current_profile = profile
-
-        # Add BASICWL+ text elements
-        self._add_text_element(root, self.creditor_reference_id, self.XML_ELEMENTS['creditor_ref'], 
-                             profile, InvoiceProfile.BASICWL)
-        self._add_text_element(root, self.payment_reference, self.XML_ELEMENTS['payment_ref'],
-                             profile, InvoiceProfile.BASICWL)
-        self._add_text_element(root, self.tax_currency_code, self.XML_ELEMENTS['tax_currency'],
-                             profile, InvoiceProfile.BASICWL)
-
-        # Add required elements
-        ET.SubElement(root, f"{{{NAMESPACES[RAM]}}}{self.XML_ELEMENTS['invoice_currency']}").text = \
-            self.invoice_currency_code
-
-        self._add_object_element(root, self.payee_trade_party, self.XML_ELEMENTS['payee'],
-                               profile, InvoiceProfile.BASICWL)
-        self._add_object_element(root, self.billing_specified_period, self.XML_ELEMENTS['period'],
-                               profile, InvoiceProfile.BASICWL)
-
-
-        self._add_list_elements(root, self.specified_trade_settlement_payment_means, 
-                              self.XML_ELEMENTS['payment_means'], profile, InvoiceProfile.BASICWL)
-        self._add_list_elements(root, self.applicable_trade_tax, self.XML_ELEMENTS['tax'],
-                              profile, InvoiceProfile.BASICWL)
-        self._add_object_element(root, self.specified_trade_payment_terms, self.XML_ELEMENTS['payment_terms'],
-                                 profile, InvoiceProfile.BASICWL)
-        self._add_list_elements(root, self.specified_trade_allowance_charge, self.XML_ELEMENTS['allowance'],
-                              profile, InvoiceProfile.BASICWL)
-        self._add_list_elements(root, self.invoice_referenced_documents, self.XML_ELEMENTS['invoice_ref'],
-                              profile, InvoiceProfile.BASICWL)
-
-        # Add required monetary summation
-        root.append(self.specified_trade_settlement_header_monetary_summation.to_xml(
-            self.XML_ELEMENTS['monetary_summation'], profile))
-
-        # Add optional accounting account
-        self._add_object_element(root, self.receivable_specified_trade_accounting_account,
-                               self.XML_ELEMENTS['accounting'], profile, InvoiceProfile.BASICWL)
-
-        return root
\ No newline at end of file
+        root = ET.Element(get_qualified_name(RAM, element_name))
+        self.populate_element(root, profile)
+        return root
+
+    @override
+    def populate_element(self, root: ET.Element, profile: InvoiceProfile) -> None:
+        """Writes the trade settlement content into an existing element.
+
+        Fields flagged (BASICWL+) are only emitted for BASICWL and higher profiles.
+        """
+        sub_element = ET.SubElement
+        append = root.append
+        extend = root.extend
+
+        for kind, get_value, name in _EMIT_PLANS[profile]:
+            value = get_value(self)
+            if value is None:
+                continue
+            if kind == _TEXT:
+                sub_element(root, name).text = value
+            elif kind == _CHILD:
+                append(value.to_xml(name, profile))
+            else:
+                extend([item.to_xml(name, profile) for item in value])
+
+
+# Emit kinds: a text leaf under a Clark tag, or one or many child models under an element name
+_TEXT, _CHILD, _CHILDREN = 0, 1, 2
+
+# (kind, field getter, tag or element name) for MINIMUM, in XML order
+_MINIMUM_PLAN = (
+    (_TEXT, attrgetter('invoice_currency_code'), _TAG_INVOICE_CURRENCY),
+    (_CHILD, attrgetter('specified_trade_settlement_header_monetary_summation'), _EL_MONETARY_SUMMATION),
+)
+# (kind, field getter, tag or element name) for BASICWL and above, in XML order
+_BASICWL_PLAN = (
+    (_TEXT, attrgetter('creditor_reference_id'), _TAG_CREDITOR_REF),
+    (_TEXT, attrgetter('payment_reference'), _TAG_PAYMENT_REF),
+    (_TEXT, attrgetter('tax_currency_code'), _TAG_TAX_CURRENCY),
+    (_TEXT, attrgetter('invoice_currency_code'), _TAG_INVOICE_CURRENCY),
+    (_CHILD, attrgetter('payee_trade_party'), _EL_PAYEE),
+    (_CHILD, attrgetter('billing_specified_period'), _EL_PERIOD),
+    (_CHILDREN, attrgetter('specified_trade_settlement_payment_means'), _EL_PAYMENT_MEANS),
+    (_CHILDREN, attrgetter('applicable_trade_tax'), _EL_TAX),
+    (_CHILD, attrgetter('specified_trade_payment_terms'), _EL_PAYMENT_TERMS),
+    (_CHILDREN, attrgetter('specified_trade_allowance_charge'), _EL_ALLOWANCE),
+    (_CHILDREN, attrgetter('invoice_referenced_documents'), _EL_INVOICE_REF),
+    (_CHILD, attrgetter('specified_trade_settlement_header_monetary_summation'), _EL_MONETARY_SUMMATION),
+    (_CHILD, attrgetter('receivable_specified_trade_accounting_account'), _EL_ACCOUNTING),
+)
+
+# Emit plan for each profile, resolved once at import
+_EMIT_PLANS = {
+    profile: _BASICWL_PLAN if profile >= InvoiceProfile.BASICWL else _MINIMUM_PLAN
+    for profile in InvoiceProfile
+}
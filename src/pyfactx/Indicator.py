@@ -1,11 +1,33 @@
-from typing import ClassVar
+from copy import copy
+from functools import lru_cache
+
 from lxml import etree as ET
 from pydantic import Field, ConfigDict
 from typing_extensions import override
 
 from .InvoiceProfile import InvoiceProfile
 from .XMLBaseModel import XMLBaseModel
-from .namespaces import NAMESPACES, RAM, UDT
+from .namespaces import RAM, UDT, get_qualified_name
+
+_TAG_INDICATOR = get_qualified_name(UDT, "Indicator")
+
+# XML boolean literals, indexed by the bool value
+_BOOL_STR = ("false", "true")
+
+
+@lru_cache(maxsize=64)
+def _indicator_template(element_name: str, value: bool) -> ET.Element:
+    """Builds the indicator subtree for an element name and value, cached.
+
+    The returned element is shared and must be copied before use.
+    """
+    root = ET.Element(get_qualified_name(RAM, element_name))
+
+    # Add indicator element with proper namespace
+    indicator_element = ET.SubElement(root, _TAG_INDICATOR)
+    indicator_element.text = _BOOL_STR[value]
+
+    return root
 
 
 class Indicator(XMLBaseModel):
@@ -20,15 +42,9 @@ class Indicator(XMLBaseModel):
     """
 
     model_config = ConfigDict(
-        frozen=True,  # Makes the class immutable
-        validate_assignment=True
+        frozen=True  # Makes the class immutable
     )
 
-    # XML element names
-    XML_ELEMENTS: ClassVar[dict[str, str]] = {
-        'indicator': 'Indicator'
-    }
-
     indicator: bool = Field(
         ...,
         description="Boolean value to be represented as XML indicator"
@@ -51,35 +67,26 @@ class Indicator(XMLBaseModel):
             >>> ET.tostring(xml)
             b'<ram:MyIndicator><udt:Indicator>true</udt:Indicator></ram:MyIndicator>'
         """
-        # Create root element
-        root = ET.Element(f"{{{NAMESPACES[RAM]}}}{element_name}")
-
-        # Add indicator element with proper namespace
-        indicator_element = ET.SubElement(
-            root,
-            f"{{{NAMESPACES[UDT]}}}{self.XML_ELEMENTS['indicator']}"
-        )
-        indicator_element.text = str(self.indicator).lower()
-
-        return root
+        # Each call gets its own copy, as callers append it into their tree
+        return copy(_indicator_template(element_name, self.indicator))
 
     @classmethod
     def true(cls) -> 'Indicator':
-        """Creates an Indicator instance with value True.
+        """Returns the Indicator instance with value True.
 
         Returns:
-            Indicator: A new instance with indicator set to True
+            Indicator: The shared instance with indicator set to True
         """
-        return cls(indicator=True)
+        return _INDICATOR_TRUE
 
     @classmethod
     def false(cls) -> 'Indicator':
-        """Creates an Indicator instance with value False.
+        """Returns the Indicator instance with value False.
 
         Returns:
-            Indicator: A new instance with indicator set to False
+            Indicator: The shared instance with indicator set to False
         """
-        return cls(indicator=False)
+        return _INDICATOR_FALSE
 
     def __str__(self) -> str:
         """Returns string representation of the indicator.
@@ -87,7 +94,7 @@ class Indicator(XMLBaseModel):
         Returns:
             str: 'true' or 'false'
         """
-        return str(self.indicator).lower()
+        return _BOOL_STR[self.indicator]
 
     def __bool__(self) -> bool:
         """Allows using the Indicator instance directly in boolean contexts.
@@ -95,4 +102,9 @@ class Indicator(XMLBaseModel):
         Returns:
             bool: The indicator value
         """
-        return self.indicator
\ No newline at end of file
+        return self.indicator
+
+
+# Indicator is frozen, so the two possible values are shared and built without validation
+_INDICATOR_TRUE = Indicator.fast_new(indicator=True)
+_INDICATOR_FALSE = Indicator.fast_new(indicator=False)
@@ -1,5 +1,4 @@
 from enum import StrEnum
-from typing import Dict
 
 
 class InvoiceProfile(StrEnum):
@@ -26,6 +25,9 @@ class InvoiceProfile(StrEnum):
     EN16931 = "urn:cen.eu:en16931:2017"
     EXTENDED = "urn:cen.eu:en16931:2017#conformant#urn:factur-x.eu:1p0:extended"
 
+    # Hierarchical rank, assigned below the class definition
+    _order: int
+
     def __lt__(self, other: object) -> bool:
         """Compare if this profile is less than another profile.
 
@@ -38,9 +40,9 @@ class InvoiceProfile(StrEnum):
         Raises:
             TypeError: If other is not an InvoiceProfile instance
         """
-        if not isinstance(other, InvoiceProfile):
+        if other.__class__ is not InvoiceProfile:
             return NotImplemented
-        return _invoice_profile_order[str(self.value)] < _invoice_profile_order[str(other.value)]
+        return self._order < other._order
 
     def __le__(self, other: object) -> bool:
         """Compare if this profile is less than or equal to another profile.
@@ -54,9 +56,9 @@ class InvoiceProfile(StrEnum):
         Raises:
             TypeError: If other is not an InvoiceProfile instance
         """
-        if not isinstance(other, InvoiceProfile):
+        if other.__class__ is not InvoiceProfile:
             return NotImplemented
-        return _invoice_profile_order[str(self.value)] <= _invoice_profile_order[str(other.value)]
+        return self._order <= other._order
 
     def __gt__(self, other: object) -> bool:
         """Compare if this profile is greater than another profile.
@@ -70,9 +72,9 @@ class InvoiceProfile(StrEnum):
         Raises:
             TypeError: If other is not an InvoiceProfile instance
         """
-        if not isinstance(other, InvoiceProfile):
+        if other.__class__ is not InvoiceProfile:
             return NotImplemented
-        return _invoice_profile_order[str(self.value)] > _invoice_profile_order[str(other.value)]
+        return self._order > other._order
 
     def __ge__(self, other: object) -> bool:
         """Compare if this profile is greater than or equal to another profile.
@@ -86,16 +88,12 @@ class InvoiceProfile(StrEnum):
         Raises:
             TypeError: If other is not an InvoiceProfile instance
         """
-        if not isinstance(other, InvoiceProfile):
+        if other.__class__ is not InvoiceProfile:
             return NotImplemented
-        return _invoice_profile_order[str(self.value)] >= _invoice_profile_order[str(other.value)]
+        return self._order >= other._order
 
 
-# Define the profile order mapping outside the class
-_invoice_profile_order: Dict[str, int] = {
-    str(InvoiceProfile.MINIMUM.value): 0,
-    str(InvoiceProfile.BASICWL.value): 1,
-    str(InvoiceProfile.BASIC.value): 2,
-    str(InvoiceProfile.EN16931.value): 3,
-    str(InvoiceProfile.EXTENDED.value): 4,
-}
\ No newline at end of file
+# Attach each profile's rank, in declaration order, so comparisons are plain integer compares
+for _rank, _profile in enumerate(InvoiceProfile):
+    _profile._order = _rank
+del _rank, _profile
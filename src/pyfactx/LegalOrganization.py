@@ -1,3 +1,4 @@
+import re
 from typing import Optional, override
 from lxml import etree as ET
 
@@ -5,7 +6,16 @@ from pydantic import Field, field_validator, ConfigDict
 
 from .InvoiceProfile import InvoiceProfile
 from .XMLBaseModel import XMLBaseModel
-from .namespaces import NAMESPACES, RAM
+from .namespaces import RAM, get_qualified_name
+
+_TAG_ID = get_qualified_name(RAM, "ID")
+_TAG_TRADING_BUSINESS_NAME = get_qualified_name(RAM, "TradingBusinessName")
+
+# Characters rejected in the trading business name, matched in a single pass
+_INVALID_XML_CHARS = re.compile('[<>&]')
+
+# Attributes of the ID element; lxml copies them, so the dict is shared
+_ID_ATTRIB = {"schemeID": "0002"}
 
 
 class LegalOrganization(XMLBaseModel):
@@ -28,7 +38,7 @@ class LegalOrganization(XMLBaseModel):
     model_config = ConfigDict(
         str_strip_whitespace=True,
         str_min_length=1,
-        validate_assignment=True
+        validate_assignment=False
     )
 
     id: Optional[str] = Field(
@@ -59,7 +69,7 @@ class LegalOrganization(XMLBaseModel):
         if value is not None:
             if not value.strip():
                 raise ValueError("Trading business name cannot be empty when provided")
-            if any(char in value for char in '<>&'):
+            if _INVALID_XML_CHARS.search(value):
                 raise ValueError("Trading business name contains invalid XML characters")
         return value
 
@@ -77,15 +87,14 @@ class LegalOrganization(XMLBaseModel):
         Returns:
             ET.Element: XML element containing the organization data
         """
-        root = ET.Element(f"{{{NAMESPACES[RAM]}}}{element_name}")
+        root = ET.Element(get_qualified_name(RAM, element_name))
 
         if self.id:
-            id_elem = ET.SubElement(root, f"{{{NAMESPACES[RAM]}}}ID")
+            id_elem = ET.SubElement(root, _TAG_ID, _ID_ATTRIB)
             id_elem.text = self.id
-            id_elem.set("schemeID", "0002")
 
         if profile >= InvoiceProfile.EN16931:
-            name_elem = ET.SubElement(root, f"{{{NAMESPACES[RAM]}}}TradingBusinessName")
+            name_elem = ET.SubElement(root, _TAG_TRADING_BUSINESS_NAME)
             name_elem.text = self.trading_business_name
 
         return root
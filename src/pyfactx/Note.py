@@ -5,8 +5,11 @@ from pydantic import Field, field_validator, ConfigDict
 from typing_extensions import override
 
 from .InvoiceProfile import InvoiceProfile
-from .XMLBaseModel import XMLBaseModel
-from .namespaces import NAMESPACES, RAM
+from .XMLBaseModel import XMLBaseModel, add_text_child
+from .namespaces import RAM, get_qualified_name
+
+_TAG_CONTENT = get_qualified_name(RAM, "Content")
+_TAG_SUBJECT_CODE = get_qualified_name(RAM, "SubjectCode")
 
 
 class Note(XMLBaseModel):
@@ -30,7 +33,7 @@ class Note(XMLBaseModel):
     """
 
     model_config = ConfigDict(
-        validate_assignment=True,
+        validate_assignment=False,
         str_strip_whitespace=True,
         str_max_length=1000  # Reasonable limit for note content
     )
@@ -62,45 +65,16 @@ class Note(XMLBaseModel):
         Raises:
             ValueError: If content validation fails
         """
-        # Remove excessive whitespace
+        # Collapse runs of whitespace; this also strips the ends and removes line breaks
         value = " ".join(value.split())
-        
-        # Check for minimum meaningful content
-        if len(value.strip()) < 1:
-            raise ValueError("Note content cannot be empty")
-            
-        # Check for reasonable line length
-        if any(len(line) > 200 for line in value.splitlines()):
-            raise ValueError("Note content contains lines that are too long")
-            
-        return value
-
-    @field_validator('subject_code')
-    def validate_subject_code(cls, value: Optional[str]) -> Optional[str]:
-        """Validates the subject code according to UN/EDIFACT 4451.
 
-        Args:
-            value: Subject code to validate
+        if not value:
+            raise ValueError("Note content cannot be empty")
 
-        Returns:
-            Optional[str]: Validated subject code or None
+        # With line breaks collapsed the whole note is a single line
+        if len(value) > 200:
+            raise ValueError("Note content contains lines that are too long")
 
-        Raises:
-            ValueError: If subject code validation fails
-        """
-        if value is not None:
-            # Convert to uppercase for consistency
-            value = value.upper()
-            
-            # Validate format
-            if not value.isalnum():
-                raise ValueError(
-                    "Subject code must contain only letters and numbers"
-                )
-                
-            if len(value) > 3:
-                raise ValueError("Subject code cannot exceed 3 characters")
-                
         return value
 
     @override
@@ -117,22 +91,13 @@ class Note(XMLBaseModel):
         Returns:
             ET.Element: XML element containing the note data
         """
-        root = ET.Element(f"{{{NAMESPACES[RAM]}}}{element_name}")
+        root = ET.Element(get_qualified_name(RAM, element_name))
 
         # Content (required)
-        content_element = ET.SubElement(
-            root,
-            f"{{{NAMESPACES[RAM]}}}Content"
-        )
-        content_element.text = self.content
+        add_text_child(root, _TAG_CONTENT, self.content)
 
         # SubjectCode (optional)
-        if self.subject_code:
-            subject_element = ET.SubElement(
-                root,
-                f"{{{NAMESPACES[RAM]}}}SubjectCode"
-            )
-            subject_element.text = self.subject_code
+        add_text_child(root, _TAG_SUBJECT_CODE, self.subject_code)
 
         return root
 
@@ -158,17 +123,18 @@ class Note(XMLBaseModel):
         words = self.content.split()
         lines = []
         current_line = []
-        current_length = 0
+        # Length of the current line; -1 cancels the separator counted for its first word
+        current_length = -1
 
         for word in words:
             word_length = len(word)
-            if current_length + word_length + 1 <= max_line_length:
+            if current_length + word_length + 1 <= max_line_length or not current_line:
                 current_line.append(word)
                 current_length += word_length + 1
             else:
                 lines.append(" ".join(current_line))
                 current_line = [word]
-                current_length = word_length + 1
+                current_length = word_length
 
         if current_line:
             lines.append(" ".join(current_line))
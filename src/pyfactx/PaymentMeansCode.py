@@ -2,6 +2,26 @@ from enum import Enum
 from typing import Dict, Optional
 
 
+# Human-readable descriptions, by code value
+_CODE_DESCRIPTIONS: Dict[int, str] = {
+    30: "Credit transfer",
+    58: "SEPA credit transfer",
+    59: "SEPA direct debit",
+    54: "Payment by credit card",
+    55: "Payment by debit card",
+    10: "Cash payment",
+    49: "Direct debit",
+    20: "Payment by cheque",
+    68: "Online payment service",
+    # Add more descriptions as needed
+}
+
+# Code values of electronic payment methods
+_ELECTRONIC_PAYMENT_CODES = frozenset({
+    30, 31, 42, 45, 47, 48, 49, 54, 55, 58, 59, 68
+})
+
+
 class PaymentMeansCode(Enum):
     """Payment means codes according to UN/CEFACT 4461.
 
@@ -131,19 +151,7 @@ class PaymentMeansCode(Enum):
             >>> PaymentMeansCode.get_description(54)
             'Payment by credit card'
         """
-        descriptions: Dict[int, str] = {
-            30: "Credit transfer",
-            58: "SEPA credit transfer",
-            59: "SEPA direct debit",
-            54: "Payment by credit card",
-            55: "Payment by debit card",
-            10: "Cash payment",
-            49: "Direct debit",
-            20: "Payment by cheque",
-            68: "Online payment service",
-            # Add more descriptions as needed
-        }
-        return descriptions.get(code)
+        return _CODE_DESCRIPTIONS.get(code)
 
     @classmethod
     def is_electronic_payment(cls, code: int) -> bool:
@@ -161,10 +169,7 @@ class PaymentMeansCode(Enum):
             >>> PaymentMeansCode.is_electronic_payment(10)
             False
         """
-        electronic_methods = {
-            30, 31, 42, 45, 47, 48, 49, 54, 55, 58, 59, 68
-        }
-        return code in electronic_methods
+        return code in _ELECTRONIC_PAYMENT_CODES
 
     def __str__(self) -> str:
         """Returns a human-readable string representation of the payment means code.
@@ -173,5 +178,11 @@ class PaymentMeansCode(Enum):
             str: Description of the payment means or the enum name if no description
                  is available
         """
-        description = self.get_description(self.value)
-        return description or self.name.replace('_', ' ').title()
\ No newline at end of file
+        return _DISPLAY_NAMES[self]
+
+
+# str() of each member: its description, or else its title-cased name
+_DISPLAY_NAMES: Dict[PaymentMeansCode, str] = {
+    member: _CODE_DESCRIPTIONS.get(member.value) or member.name.replace('_', ' ').title()
+    for member in PaymentMeansCode
+}
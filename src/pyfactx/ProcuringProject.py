@@ -1,11 +1,20 @@
+import re
 from lxml import etree as ET
 from typing import override
 
 from pydantic import Field, field_validator, ConfigDict
 
 from .InvoiceProfile import InvoiceProfile
-from .XMLBaseModel import XMLBaseModel
-from .namespaces import NAMESPACES, RAM
+from .XMLBaseModel import XMLBaseModel, add_text_child
+from .namespaces import RAM, get_qualified_name
+
+_TAG_ID = get_qualified_name(RAM, "ID")
+_TAG_NAME = get_qualified_name(RAM, "Name")
+
+# Letters, digits and -_. only; \w is Unicode alphanumerics plus underscore
+_ID_CHARS = re.compile(r'[\w.\-]*')
+# Any Unicode alphanumeric character
+_ALNUM_CHAR = re.compile(r'[^\W_]')
 
 
 class ProcuringProject(XMLBaseModel):
@@ -26,7 +35,7 @@ class ProcuringProject(XMLBaseModel):
     """
 
     model_config = ConfigDict(
-        validate_assignment=True,
+        validate_assignment=False,
         str_strip_whitespace=True,
         str_max_length=256  # Reasonable limit for project details
     )
@@ -64,13 +73,13 @@ class ProcuringProject(XMLBaseModel):
         value = value.strip()
         
         # Check for valid characters
-        if not all(c.isalnum() or c in '-_.' for c in value):
+        if not _ID_CHARS.fullmatch(value):
             raise ValueError(
                 "Project ID can only contain letters, numbers, and -_."
             )
             
         # Check for reasonable format
-        if not any(c.isalnum() for c in value):
+        if not _ALNUM_CHAR.search(value):
             raise ValueError("Project ID must contain at least one alphanumeric character")
             
         return value
@@ -115,21 +124,13 @@ class ProcuringProject(XMLBaseModel):
         Returns:
             ET.Element: XML element containing the project data
         """
-        root = ET.Element(f"{{{NAMESPACES[RAM]}}}{element_name}")
+        root = ET.Element(get_qualified_name(RAM, element_name))
 
         # ID (required)
-        id_element = ET.SubElement(
-            root,
-            f"{{{NAMESPACES[RAM]}}}ID"
-        )
-        id_element.text = self.id
+        add_text_child(root, _TAG_ID, self.id)
 
         # Name (required)
-        name_element = ET.SubElement(
-            root,
-            f"{{{NAMESPACES[RAM]}}}Name"
-        )
-        name_element.text = self.name
+        add_text_child(root, _TAG_NAME, self.name)
 
         return root
 
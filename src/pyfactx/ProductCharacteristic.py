@@ -4,8 +4,11 @@ from typing import override
 from pydantic import Field, field_validator, ConfigDict
 
 from .InvoiceProfile import InvoiceProfile
-from .XMLBaseModel import XMLBaseModel
-from .namespaces import NAMESPACES, RAM
+from .XMLBaseModel import XMLBaseModel, add_text_child
+from .namespaces import RAM, get_qualified_name
+
+_TAG_DESCRIPTION = get_qualified_name(RAM, "Description")
+_TAG_VALUE = get_qualified_name(RAM, "Value")
 
 
 class ProductCharacteristic(XMLBaseModel):
@@ -30,7 +33,7 @@ class ProductCharacteristic(XMLBaseModel):
     """
 
     model_config = ConfigDict(
-        validate_assignment=True,
+        validate_assignment=False,
         str_strip_whitespace=True,
         str_max_length=1000
     )
@@ -76,7 +79,7 @@ class ProductCharacteristic(XMLBaseModel):
             raise ValueError("Characteristic description is too long")
             
         # Check for valid characters
-        if not all(c.isprintable() for c in value):
+        if not value.isprintable():
             raise ValueError("Description contains invalid characters")
             
         return value
@@ -106,7 +109,7 @@ class ProductCharacteristic(XMLBaseModel):
             raise ValueError("Characteristic value is too long")
             
         # Check for valid characters
-        if not all(c.isprintable() for c in value):
+        if not value.isprintable():
             raise ValueError("Value contains invalid characters")
             
         return value
@@ -125,21 +128,13 @@ class ProductCharacteristic(XMLBaseModel):
         Returns:
             ET.Element: XML element containing the characteristic data
         """
-        root = ET.Element(f"{{{NAMESPACES[RAM]}}}{element_name}")
+        root = ET.Element(get_qualified_name(RAM, element_name))
 
         # Description (required)
-        description_element = ET.SubElement(
-            root,
-            f"{{{NAMESPACES[RAM]}}}Description"
-        )
-        description_element.text = self.description
+        add_text_child(root, _TAG_DESCRIPTION, self.description)
 
         # Value (required)
-        value_element = ET.SubElement(
-            root,
-            f"{{{NAMESPACES[RAM]}}}Value"
-        )
-        value_element.text = self.value
+        add_text_child(root, _TAG_VALUE, self.value)
 
         return root
 
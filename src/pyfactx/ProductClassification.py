@@ -1,3 +1,4 @@
+import re
 from typing import Optional, Dict, ClassVar
 from lxml import etree as ET
 from typing_extensions import override
@@ -6,7 +7,13 @@ from pydantic import Field, field_validator, ConfigDict
 
 from .InvoiceProfile import InvoiceProfile
 from .XMLBaseModel import XMLBaseModel
-from .namespaces import NAMESPACES, RAM
+from .namespaces import RAM, get_qualified_name
+
+_TAG_CLASS_CODE = get_qualified_name(RAM, "ClassCode")
+
+# Allowed characters; \w is Unicode alphanumerics plus underscore, like str.isalnum() or '_'
+_LIST_ID_CHARS = re.compile(r'[\w-]*')
+_CLASS_CODE_CHARS = re.compile(r'[\w.\-]*')
 
 
 class ProductClassification(XMLBaseModel):
@@ -42,7 +49,7 @@ class ProductClassification(XMLBaseModel):
     }
 
     model_config = ConfigDict(
-        validate_assignment=True,
+        validate_assignment=False,
         str_strip_whitespace=True
     )
 
@@ -81,7 +88,7 @@ class ProductClassification(XMLBaseModel):
             # Validate known schemes
             if value not in cls.KNOWN_CLASSIFICATION_SCHEMES:
                 # Allow custom schemes but warn about unknown ones
-                if not all(c.isalnum() or c in '-_' for c in value):
+                if not _LIST_ID_CHARS.fullmatch(value):
                     raise ValueError(
                         "Classification scheme ID can only contain letters, "
                         "numbers, hyphens and underscores"
@@ -109,7 +116,7 @@ class ProductClassification(XMLBaseModel):
         value = value.strip()
         
         # Basic format validation
-        if not all(c.isalnum() or c in '-._' for c in value):
+        if not _CLASS_CODE_CHARS.fullmatch(value):
             raise ValueError(
                 "Classification code can only contain letters, numbers, "
                 "hyphens, dots and underscores"
@@ -138,18 +145,13 @@ class ProductClassification(XMLBaseModel):
         Returns:
             ET.Element: XML element containing the classification data
         """
-        root = ET.Element(f"{{{NAMESPACES[RAM]}}}{element_name}")
+        root = ET.Element(get_qualified_name(RAM, element_name))
 
         # ClassCode with optional listID attribute
-        attrib: Dict[str, str] = {}
         if self.list_id:
-            attrib["listID"] = self.list_id
-            
-        class_code_element = ET.SubElement(
-            root,
-            f"{{{NAMESPACES[RAM]}}}ClassCode",
-            attrib=attrib
-        )
+            class_code_element = ET.SubElement(root, _TAG_CLASS_CODE, listID=self.list_id)
+        else:
+            class_code_element = ET.SubElement(root, _TAG_CLASS_CODE)
         class_code_element.text = self.class_code
 
         return root
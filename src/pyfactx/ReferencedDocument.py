@@ -1,4 +1,6 @@
+import re
 from datetime import datetime
+from operator import attrgetter
 from typing import Optional
 from lxml import etree as ET
 
@@ -9,8 +11,41 @@ from urllib.parse import urlparse
 from .BinaryObject import BinaryObject
 from .DocumentTypeCode import DocumentTypeCode
 from .InvoiceProfile import InvoiceProfile
-from .XMLBaseModel import XMLBaseModel
-from .namespaces import NAMESPACES, RAM, UDT
+from .XMLBaseModel import XMLBaseModel, format_date_102
+from .namespaces import RAM, UDT, get_qualified_name
+
+_TAG_ISSUER_ASSIGNED_ID = get_qualified_name(RAM, "IssuerAssignedID")
+_TAG_URIID = get_qualified_name(RAM, "URIID")
+_TAG_LINE_ID = get_qualified_name(RAM, "LineID")
+_TAG_TYPE_CODE = get_qualified_name(RAM, "TypeCode")
+_TAG_NAME = get_qualified_name(RAM, "Name")
+_TAG_REFERENCE_TYPE_CODE = get_qualified_name(RAM, "ReferenceTypeCode")
+_TAG_FORMATTED_ISSUE_DATE_TIME = get_qualified_name(RAM, "FormattedIssueDateTime")
+_TAG_DATE_TIME_STRING = get_qualified_name(UDT, "DateTimeString")
+
+# Allowed characters; \w is Unicode alphanumerics plus underscore, like str.isalnum() or '_'
+_LINE_ID_CHARS = re.compile(r'[\w.\-]*')
+_REFERENCE_TYPE_CODE_CHARS = re.compile(r'(?:[^\W_]|-)*')
+
+# scheme://authority[...] with a non-empty ASCII authority, which urlparse always accepts
+_AUTHORITY_URI = re.compile(r"[A-Za-z][A-Za-z0-9+.\-]*://[A-Za-z0-9._~%!$&'()*+,;=:@\-]+(?:[/?#].*)?", re.DOTALL)
+
+# Date format attribute, shared across calls; lxml copies it on use
+_DATE_FORMAT_ATTRIB = {"format": "102"}
+
+# Emit kinds: a text leaf, a code enum's value, a child model, or a 102-formatted date
+_TEXT, _CODE, _CHILD, _DATE = 0, 1, 2, 3
+
+# (kind, field getter, tag or element name) for the EN16931 fields, in XML order
+_EN16931_FIELDS = (
+    (_TEXT, attrgetter('uri_id'), _TAG_URIID),
+    (_TEXT, attrgetter('line_id'), _TAG_LINE_ID),
+    (_CODE, attrgetter('type_code'), _TAG_TYPE_CODE),
+    (_TEXT, attrgetter('name'), _TAG_NAME),
+    (_CHILD, attrgetter('attachment_binary_object'), "AttachmentBinaryObject"),
+    (_TEXT, attrgetter('reference_type_code'), _TAG_REFERENCE_TYPE_CODE),
+    (_DATE, attrgetter('issue_date'), _TAG_FORMATTED_ISSUE_DATE_TIME),
+)
 
 
 class ReferencedDocument(XMLBaseModel):
@@ -31,7 +66,7 @@ class ReferencedDocument(XMLBaseModel):
     """
 
     model_config = ConfigDict(
-        validate_assignment=True,
+        validate_assignment=False,
         str_strip_whitespace=True,
         str_max_length=1000
     )
@@ -120,6 +155,9 @@ class ReferencedDocument(XMLBaseModel):
         """
         if value is not None:
             value = value.strip()
+            # Most URIs have an authority; only parse the rest in full
+            if _AUTHORITY_URI.fullmatch(value):
+                return value
             try:
                 result = urlparse(value)
                 if not all([result.scheme, result.netloc or result.path]):
@@ -145,7 +183,7 @@ class ReferencedDocument(XMLBaseModel):
             value = value.strip()
             if not value:
                 raise ValueError("Line ID cannot be empty if provided")
-            if not all(c.isalnum() or c in '-_.' for c in value):
+            if not _LINE_ID_CHARS.fullmatch(value):
                 raise ValueError("Line ID contains invalid characters")
         return value
 
@@ -185,7 +223,7 @@ class ReferencedDocument(XMLBaseModel):
             value = value.strip().upper()
             if not value:
                 raise ValueError("Reference type code cannot be empty if provided")
-            if not all(c.isalnum() or c == '-' for c in value):
+            if not _REFERENCE_TYPE_CODE_CHARS.fullmatch(value):
                 raise ValueError("Reference type code contains invalid characters")
         return value
 
@@ -203,72 +241,28 @@ class ReferencedDocument(XMLBaseModel):
         Returns:
             ET.Element: XML element containing the document data
         """
-        root = ET.Element(f"{{{NAMESPACES[RAM]}}}{element_name}")
+        root = ET.Element(get_qualified_name(RAM, element_name))
 
         # IssuerAssignedID (Basic profile)
         if self.issuer_assigned_id:
-            ET.SubElement(
-                root,
-                f"{{{NAMESPACES[RAM]}}}IssuerAssignedID"
-            ).text = self.issuer_assigned_id
+            ET.SubElement(root, _TAG_ISSUER_ASSIGNED_ID).text = self.issuer_assigned_id
 
         # Extended fields for EN16931 and higher profiles
         if profile >= InvoiceProfile.EN16931:
-            # URIID
-            if self.uri_id:
-                ET.SubElement(
-                    root,
-                    f"{{{NAMESPACES[RAM]}}}URIID"
-                ).text = self.uri_id
-
-            # LineID
-            if self.line_id:
-                ET.SubElement(
-                    root,
-                    f"{{{NAMESPACES[RAM]}}}LineID"
-                ).text = self.line_id
-
-            # TypeCode
-            if self.type_code:
-                ET.SubElement(
-                    root,
-                    f"{{{NAMESPACES[RAM]}}}TypeCode"
-                ).text = str(self.type_code.value)
-
-            # Name
-            if self.name:
-                ET.SubElement(
-                    root,
-                    f"{{{NAMESPACES[RAM]}}}Name"
-                ).text = self.name
-
-            # AttachmentBinaryObject
-            if self.attachment_binary_object:
-                root.append(
-                    self.attachment_binary_object.to_xml(
-                        "AttachmentBinaryObject",
-                        profile
-                    )
-                )
-
-            # ReferenceTypeCode
-            if self.reference_type_code:
-                ET.SubElement(
-                    root,
-                    f"{{{NAMESPACES[RAM]}}}ReferenceTypeCode"
-                ).text = self.reference_type_code
-
-            # FormattedIssueDateTime
-            if self.issue_date:
-                issue_dt_element = ET.SubElement(
-                    root,
-                    f"{{{NAMESPACES[RAM]}}}FormattedIssueDateTime"
-                )
-                ET.SubElement(
-                    issue_dt_element,
-                    f"{{{NAMESPACES[UDT]}}}DateTimeString",
-                    attrib={"format": "102"}
-                ).text = self.issue_date.strftime("%Y%m%d")
+            sub_element = ET.SubElement
+            for kind, get_value, name in _EN16931_FIELDS:
+                value = get_value(self)
+                if not value:
+                    continue
+                if kind == _TEXT:
+                    sub_element(root, name).text = value
+                elif kind == _CODE:
+                    sub_element(root, name).text = str(value.value)
+                elif kind == _CHILD:
+                    root.append(value.to_xml(name, profile))
+                else:
+                    sub_element(sub_element(root, name), _TAG_DATE_TIME_STRING,
+                                _DATE_FORMAT_ATTRIB).text = format_date_102(value)
 
         return root
 
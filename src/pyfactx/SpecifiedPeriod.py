@@ -1,12 +1,26 @@
 from datetime import datetime
+from operator import attrgetter
 from typing import Optional, override
 from lxml import etree as ET
 
 from pydantic import Field, field_validator, ConfigDict, model_validator
 
 from .InvoiceProfile import InvoiceProfile
-from .XMLBaseModel import XMLBaseModel
-from .namespaces import NAMESPACES, RAM, UDT
+from .XMLBaseModel import XMLBaseModel, format_date_102
+from .namespaces import RAM, UDT, get_qualified_name
+
+_TAG_START_DATE_TIME = get_qualified_name(RAM, "StartDateTime")
+_TAG_END_DATE_TIME = get_qualified_name(RAM, "EndDateTime")
+_TAG_DATE_TIME_STRING = get_qualified_name(UDT, "DateTimeString")
+
+# Date format attribute, shared across calls; lxml copies it on use
+_DATE_FORMAT_ATTRIB = {"format": "102"}
+
+# (field getter, tag) of the period bounds, in XML order
+_DATE_FIELDS = (
+    (attrgetter('start_date'), _TAG_START_DATE_TIME),
+    (attrgetter('end_date'), _TAG_END_DATE_TIME),
+)
 
 
 class SpecifiedPeriod(XMLBaseModel):
@@ -101,31 +115,13 @@ class SpecifiedPeriod(XMLBaseModel):
         Returns:
             ET.Element: XML element containing the period data
         """
-        root = ET.Element(f"{{{NAMESPACES[RAM]}}}{element_name}")
-
-        # StartDateTime
-        if self.start_date:
-            start_elem = ET.SubElement(
-                root,
-                f"{{{NAMESPACES[RAM]}}}StartDateTime"
-            )
-            ET.SubElement(
-                start_elem,
-                f"{{{NAMESPACES[UDT]}}}DateTimeString",
-                attrib={"format": "102"}
-            ).text = self.start_date.strftime("%Y%m%d")
-
-        # EndDateTime
-        if self.end_date:
-            end_elem = ET.SubElement(
-                root,
-                f"{{{NAMESPACES[RAM]}}}EndDateTime"
-            )
-            ET.SubElement(
-                end_elem,
-                f"{{{NAMESPACES[UDT]}}}DateTimeString",
-                attrib={"format": "102"}
-            ).text = self.end_date.strftime("%Y%m%d")
+        root = ET.Element(get_qualified_name(RAM, element_name))
+
+        for get_value, tag in _DATE_FIELDS:
+            value = get_value(self)
+            if value:
+                ET.SubElement(ET.SubElement(root, tag), _TAG_DATE_TIME_STRING,
+                              _DATE_FORMAT_ATTRIB).text = format_date_102(value)
 
         return root
 
@@ -5,7 +5,7 @@ from pydantic import Field, field_validator, ConfigDict
 from typing_extensions import override
 
 from .InvoiceProfile import InvoiceProfile
-from .XMLBaseModel import XMLBaseModel
+from .XMLBaseModel import XMLBaseModel, format_date_102
 from .namespaces import NAMESPACES, RAM, UDT
 
 
@@ -80,7 +80,7 @@ class SupplyChainEvent(XMLBaseModel):
             occ_date_elem,
             f"{{{NAMESPACES[UDT]}}}DateTimeString",
             attrib={"format": "102"}
-        ).text = self.occurrence_date.strftime("%Y%m%d")
+        ).text = format_date_102(self.occurrence_date)
 
         return root
 
@@ -12,7 +12,9 @@ from .LineTradeDelivery import LineTradeDelivery
 from .LineTradeSettlement import LineTradeSettlement
 from .TradeProduct import TradeProduct
 from .XMLBaseModel import XMLBaseModel
-from .namespaces import NAMESPACES, RAM
+from .namespaces import RAM, get_qualified_name
+
+_TAG_LINE_TRADE_AGREEMENT = get_qualified_name(RAM, "SpecifiedLineTradeAgreement")
 
 
 class SupplyChainTradeLineItem(XMLBaseModel):
@@ -83,7 +85,7 @@ class SupplyChainTradeLineItem(XMLBaseModel):
         Returns:
             ET.Element: XML element containing the line item data
         """
-        root = ET.Element(f"{{{NAMESPACES[RAM]}}}{element_name}")
+        root = ET.Element(get_qualified_name(RAM, element_name))
 
         # AssociatedDocumentLineDocument
         root.append(
@@ -102,11 +104,9 @@ class SupplyChainTradeLineItem(XMLBaseModel):
         )
 
         # SpecifiedLineTradeAgreement
-        root.append(
-            self.specified_line_trade_agreement.to_xml(
-                "SpecifiedLineTradeAgreement",
-                profile
-            )
+        self.specified_line_trade_agreement.populate_element(
+            ET.SubElement(root, _TAG_LINE_TRADE_AGREEMENT),
+            profile
         )
 
         # SpecifiedLineTradeDelivery
@@ -11,7 +11,9 @@ from .HeaderTradeSettlement import HeaderTradeSettlement
 from .InvoiceProfile import InvoiceProfile
 from .SupplyChainTradeLineItem import SupplyChainTradeLineItem
 from .XMLBaseModel import XMLBaseModel
-from .namespaces import NAMESPACES, RSM
+from .namespaces import NAMESPACES, RAM, RSM, get_qualified_name
+
+_TAG_HEADER_TRADE_SETTLEMENT = get_qualified_name(RAM, "ApplicableHeaderTradeSettlement")
 
 
 class SupplyChainTradeTransaction(XMLBaseModel):
@@ -74,13 +76,6 @@ class SupplyChainTradeTransaction(XMLBaseModel):
         Raises:
             ValueError: If validation fails
         """
-        # Validate line items presence for BASIC profile and above
-        if hasattr(self, '_profile') and self._profile >= InvoiceProfile.BASIC:
-            if not self.included_supply_chain_trade_line_items:
-                raise ValueError(
-                    "Line items are mandatory for BASIC profile and above"
-                )
-
         # Validate line items if present
         if self.included_supply_chain_trade_line_items:
             if len(self.included_supply_chain_trade_line_items) > 999999:
@@ -97,6 +92,27 @@ class SupplyChainTradeTransaction(XMLBaseModel):
 
         return self
 
+    def validate_for(self, profile: InvoiceProfile) -> None:
+        """Validates that the transaction is complete for the given profile.
+
+        Also runs validate_for on the header trade delivery and settlement, so
+        fields that to_xml would silently leave out for the profile are rejected.
+
+        Args:
+            profile: The Factur-X profile the transaction will be serialized for
+
+        Raises:
+            ValueError: If line items are missing for BASIC profile and above,
+                or a header field is not allowed in the profile
+        """
+        if profile >= InvoiceProfile.BASIC and not self.included_supply_chain_trade_line_items:
+            raise ValueError(
+                "Line items are mandatory for BASIC profile and above"
+            )
+
+        self.applicable_header_trade_delivery.validate_for(profile)
+        self.applicable_header_trade_settlement.validate_for(profile)
+
     @override
     def to_xml(self, element_name: str, profile: InvoiceProfile) -> ET.Element:
         """Converts the transaction to XML format.
@@ -116,13 +132,10 @@ class SupplyChainTradeTransaction(XMLBaseModel):
         if profile >= InvoiceProfile.BASIC:
             # IncludedSupplyChainTradeLineItems
             if self.included_supply_chain_trade_line_items:
-                for line_item in self.included_supply_chain_trade_line_items:
-                    root.append(
-                        line_item.to_xml(
-                            "IncludedSupplyChainTradeLineItem",
-                            profile
-                        )
-                    )
+                root.extend([
+                    line_item.to_xml("IncludedSupplyChainTradeLineItem", profile)
+                    for line_item in self.included_supply_chain_trade_line_items
+                ])
 
         # ApplicableHeaderTradeAgreement
         root.append(
@@ -141,11 +154,9 @@ class SupplyChainTradeTransaction(XMLBaseModel):
         )
 
         # ApplicableHeaderTradeSettlement
-        root.append(
-            self.applicable_header_trade_settlement.to_xml(
-                "ApplicableHeaderTradeSettlement",
-                profile
-            )
+        self.applicable_header_trade_settlement.populate_element(
+            ET.SubElement(root, _TAG_HEADER_TRADE_SETTLEMENT),
+            profile
         )
 
         return root
@@ -5,7 +5,7 @@ from lxml import etree as ET
 from pydantic import Field, field_validator
 
 from .InvoiceProfile import InvoiceProfile
-from .XMLBaseModel import XMLBaseModel
+from .XMLBaseModel import XMLBaseModel, format_date_102
 from .namespaces import NAMESPACES, RAM, UDT
 
 
@@ -117,7 +117,7 @@ class TradePaymentTerms(XMLBaseModel):
                 due_date_elem,
                 f"{{{NAMESPACES[UDT]}}}DateTimeString",
                 attrib={"format": "102"}
-            ).text = self.due_date.strftime("%Y%m%d")
+            ).text = format_date_102(self.due_date)
 
         # DirectDebitMandateID
         if self.direct_debit_mandate_id:
@@ -1,4 +1,6 @@
+from copy import copy
 from decimal import Decimal
+from functools import lru_cache
 from typing import Optional, override
 from lxml import etree as ET
 
@@ -6,12 +8,36 @@ from pydantic import Field, field_validator, ConfigDict
 from pydantic_core.core_schema import ValidationInfo
 from typing_extensions import Annotated
 
-from .namespaces import NAMESPACES, RAM
+from .namespaces import RAM, get_qualified_name
 from .InvoiceProfile import InvoiceProfile
 from .TradeAllowanceCharge import TradeAllowanceCharge
 from .UnitCode import UnitCode
 from .XMLBaseModel import XMLBaseModel
 
+_TAG_CHARGE_AMOUNT = get_qualified_name(RAM, "ChargeAmount")
+_TAG_BASIS_QUANTITY = get_qualified_name(RAM, "BasisQuantity")
+
+
+@lru_cache(maxsize=1024)
+def _price_template(element_name: str, charge_amount: float, quantity: Optional[float],
+                    unit: Optional[UnitCode]) -> ET.Element:
+    """Builds the price subtree without allowance or charge, cached.
+
+    Catalog prices repeat across invoice lines, so each distinct price is
+    built once. The returned element is shared and must be copied before use.
+    """
+    root = ET.Element(get_qualified_name(RAM, element_name))
+
+    # ChargeAmount
+    ET.SubElement(root, _TAG_CHARGE_AMOUNT).text = f"{charge_amount:.4f}"
+
+    # BasisQuantity
+    if quantity is not None:
+        attrib = {"unitCode": str(unit)} if unit else {}
+        ET.SubElement(root, _TAG_BASIS_QUANTITY, attrib=attrib).text = f"{quantity:.3f}"
+
+    return root
+
 
 class TradePrice(XMLBaseModel):
     """Represents a trade price according to UN/CEFACT standards.
@@ -82,21 +108,8 @@ class TradePrice(XMLBaseModel):
             </ram:GrossPriceProductTradePrice>
             ```
         """
-        root = ET.Element(f"{{{NAMESPACES[RAM]}}}{element_name}")
-
-        # ChargeAmount
-        amount_str = f"{self.charge_amount:.4f}"
-        ET.SubElement(root, f"{{{NAMESPACES[RAM]}}}ChargeAmount").text = amount_str
-
-        # BasisQuantity
-        if self.quantity is not None:
-            attrib = {"unitCode": str(self.unit)} if self.unit else {}
-            quantity_str = f"{self.quantity:.3f}"
-            ET.SubElement(
-                root,
-                f"{{{NAMESPACES[RAM]}}}BasisQuantity",
-                attrib=attrib
-            ).text = quantity_str
+        # Each call gets its own copy, as callers append it into their tree
+        root = copy(_price_template(element_name, self.charge_amount, self.quantity, self.unit))
 
         # AppliedTradeAllowanceCharge
         if self.applied_trade_allowance_charge:
@@ -8,7 +8,7 @@ from .ProductCharacteristic import ProductCharacteristic
 from .ProductClassification import ProductClassification
 from .TradeCountry import TradeCountry
 from .XMLBaseModel import XMLBaseModel
-from .namespaces import NAMESPACES, RAM
+from .namespaces import NAMESPACES, RAM, get_qualified_name
 
 
 class TradeProduct(XMLBaseModel):
@@ -146,13 +146,15 @@ class TradeProduct(XMLBaseModel):
             </ram:SpecifiedTradeProduct>
             ```
         """
-        root = ET.Element(f"{{{NAMESPACES[RAM]}}}{element_name}")
+        root = ET.Element(get_qualified_name(RAM, element_name))
+        # Compared once, as both EN16931 blocks below depend on it
+        en16931 = profile >= InvoiceProfile.EN16931
 
         # GlobalID
         if self.global_id:
             ET.SubElement(root, f"{{{NAMESPACES[RAM]}}}GlobalID").text = self.global_id
 
-        if profile >= InvoiceProfile.EN16931:
+        if en16931:
             # SellerAssignedID
             if self.seller_assigned_id:
                 ET.SubElement(root, f"{{{NAMESPACES[RAM]}}}SellerAssignedID").text = self.seller_assigned_id
@@ -164,20 +166,24 @@ class TradeProduct(XMLBaseModel):
         # Name
         ET.SubElement(root, f"{{{NAMESPACES[RAM]}}}Name").text = self.name
 
-        if profile >= InvoiceProfile.EN16931:
+        if en16931:
             # Description
             if self.description:
                 ET.SubElement(root, f"{{{NAMESPACES[RAM]}}}Description").text = self.description
 
             # ApplicableProductCharacteristic
             if self.applicable_product_characteristics:
-                for characteristic in self.applicable_product_characteristics:
-                    root.append(characteristic.to_xml("ApplicableProductCharacteristic", profile))
+                root.extend([
+                    characteristic.to_xml("ApplicableProductCharacteristic", profile)
+                    for characteristic in self.applicable_product_characteristics
+                ])
 
             # DesignatedProductClassification
             if self.designated_product_classifications:
-                for classification in self.designated_product_classifications:
-                    root.append(classification.to_xml("DesignatedProductClassification", profile))
+                root.extend([
+                    classification.to_xml("DesignatedProductClassification", profile)
+                    for classification in self.designated_product_classifications
+                ])
 
             # OriginTradeCountry
             if self.origin_trade_country:
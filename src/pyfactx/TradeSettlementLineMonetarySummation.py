@@ -6,7 +6,7 @@ from typing_extensions import override
 
 from .InvoiceProfile import InvoiceProfile
 from .XMLBaseModel import XMLBaseModel
-from .namespaces import NAMESPACES, RAM
+from .namespaces import NAMESPACES, RAM, get_qualified_name
 
 
 class TradeSettlementLineMonetarySummation(XMLBaseModel):
@@ -101,7 +101,7 @@ class TradeSettlementLineMonetarySummation(XMLBaseModel):
             </ram:SpecifiedTradeSettlementLineMonetarySummation>
             ```
         """
-        root = ET.Element(f"{{{NAMESPACES[RAM]}}}{element_name}")
+        root = ET.Element(get_qualified_name(RAM, element_name))
 
         # LineTotalAmount with proper formatting
         attrib = {"currencyID": self.currency_code} if self.currency_code else {}
@@ -9,8 +9,8 @@ from .TaxCategoryCode import TaxCategoryCode
 from .TaxTypeCode import TaxTypeCode
 from .TimeReferenceCode import TimeReferenceCode
 from .VATExemptionReasonCode import VATExemptionReasonCode
-from .XMLBaseModel import XMLBaseModel
-from .namespaces import NAMESPACES, RAM, UDT
+from .XMLBaseModel import XMLBaseModel, format_date_102
+from .namespaces import NAMESPACES, RAM, UDT, get_qualified_name
 
 
 class TradeTax(XMLBaseModel):
@@ -27,7 +27,7 @@ class TradeTax(XMLBaseModel):
 
     @override
     def to_xml(self, element_name: str, profile: InvoiceProfile) -> ET.Element:
-        root = ET.Element(f"{{{NAMESPACES[RAM]}}}{element_name}")
+        root = ET.Element(get_qualified_name(RAM, element_name))
 
         # CalculatedAmount
         if self.calculated_amount is not None:
@@ -56,7 +56,7 @@ class TradeTax(XMLBaseModel):
             if self.tax_point_date:
                 tax_point_element = ET.SubElement(root, f"{{{NAMESPACES[RAM]}}}TaxPointDate")
                 ET.SubElement(tax_point_element, f"{{{NAMESPACES[UDT]}}}DateString",
-                              attrib={"format": "102"}).text = self.tax_point_date.strftime("%Y%m%d")
+                              attrib={"format": "102"}).text = format_date_102(self.tax_point_date)
 
         # DueDateTypeCode
         if self.due_date_type_code:
@@ -1,12 +1,51 @@
 from abc import ABC, abstractmethod
+from datetime import date
+from functools import lru_cache
 from typing import Optional, Any, Dict
 from lxml import etree as ET
 
 from pydantic import BaseModel, ConfigDict
+from typing_extensions import Self
 
 from .InvoiceProfile import InvoiceProfile
 
 
+def format_date_102(value: date) -> str:
+    """Formats a date as YYYYMMDD, the UN/CEFACT format code 102.
+
+    An invoice repeats the same few dates across documents, periods and
+    taxes, so results are cached. The cache is keyed on the calendar day,
+    since aware datetimes that compare equal can still fall on different
+    local dates.
+
+    Args:
+        value: Date or datetime to format
+
+    Returns:
+        str: The formatted date
+    """
+    return _format_ordinal_102(value.toordinal())
+
+
+@lru_cache(maxsize=1024)
+def _format_ordinal_102(ordinal: int) -> str:
+    # Integer formatting skips strftime's struct tm and locale handling
+    day = date.fromordinal(ordinal)
+    return f"{day.year:04d}{day.month:02d}{day.day:02d}"
+
+
+def add_text_child(parent: ET.Element, tag: str, text: Optional[str]) -> None:
+    """Appends a text-only child element, unless the text is None.
+
+    Args:
+        parent: Element to append the child to
+        tag: Clark-notation tag of the child
+        text: Text content of the child, or None to add nothing
+    """
+    if text is not None:
+        ET.SubElement(parent, tag).text = text
+
+
 class XMLBaseModel(BaseModel, ABC):
     """Base class for XML-serializable Pydantic models.
     
@@ -39,6 +78,26 @@ class XMLBaseModel(BaseModel, ABC):
         """
         raise NotImplementedError("Child classes must implement to_xml method")
 
+    def populate_element(self, element: ET.Element, profile: InvoiceProfile) -> None:
+        """Fill an existing, empty element with the model's XML content.
+
+        Lets a parent create the child in place with ET.SubElement instead of
+        appending a separately built tree. The element's local name is used as
+        the element name.
+
+        The default implementation builds the subtree with to_xml and moves
+        its text, attributes and children into the element. Models override
+        it to write into the element directly.
+
+        Args:
+            element: Element to fill, already attached to its parent
+            profile: Invoice profile containing serialization settings
+        """
+        source = self.to_xml(ET.QName(element).localname, profile)
+        element.text = source.text
+        element.attrib.update(source.attrib)
+        element.extend(list(source))
+
     def to_xml_string(self, element_name: str, profile: InvoiceProfile,
                      pretty_print: bool = False, encoding: str = 'UTF-8') -> str:
         """Convert the model to an XML string representation.
@@ -59,6 +118,24 @@ class XMLBaseModel(BaseModel, ABC):
             encoding=encoding
         ).decode(encoding)
 
+    @classmethod
+    def fast_new(cls, **data: Any) -> Self:
+        """Create a model instance from trusted data without validation.
+
+        Wraps model_construct: no field validators, model validators or type
+        coercion run, and defaults are filled in for missing fields. Only use
+        it for data that is already known to be valid, such as validated
+        model instances or values produced by this library. Untrusted input
+        must go through the regular constructor.
+
+        Args:
+            **data: Field values, by field name
+
+        Returns:
+            Self: New instance of the model's class
+        """
+        return cls.model_construct(**data)
+
     @classmethod
     def from_xml(cls, element: ET.Element) -> 'XMLBaseModel':
         """Create a model instance from an XML element.
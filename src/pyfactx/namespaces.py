@@ -20,6 +20,9 @@ Example:
     'urn:un:unece:uncefact:data:standard:ReusableAggregateBusinessInformationEntity:100'
 """
 
+import sys
+from functools import lru_cache
+
 # Namespace prefixes
 RAM = "ram"  # Reusable Aggregate Business Information Entities
 RSM = "rsm"  # Reference Semantic Model
@@ -36,13 +39,20 @@ NAMESPACES = {
     XSI: "http://www.w3.org/2001/XMLSchema-instance"
 }
 
+# URIs are not identifier-like, so the compiler does not intern them; do it once here
+NAMESPACES = {prefix: sys.intern(uri) for prefix, uri in NAMESPACES.items()}
+
 # Qualified versions of namespaces (with brackets) for direct XML use
-QUALIFIED = {prefix: f"{{{uri}}}" for prefix, uri in NAMESPACES.items()}
+QUALIFIED = {prefix: sys.intern(f"{{{uri}}}") for prefix, uri in NAMESPACES.items()}
 
 
+@lru_cache(maxsize=512)
 def get_qualified_name(prefix: str, local_name: str) -> str:
     """Creates a fully qualified XML name using namespace prefix and local name.
 
+    Results are cached and interned, so repeated calls for the same element
+    name return the same string object.
+
     Args:
         prefix: Namespace prefix (e.g., 'ram', 'rsm')
         local_name: Local part of the element name
@@ -59,7 +69,7 @@ def get_qualified_name(prefix: str, local_name: str) -> str:
     """
     if prefix not in NAMESPACES:
         raise KeyError(f"Unknown namespace prefix: {prefix}")
-    return f"{QUALIFIED[prefix]}{local_name}"
+    return sys.intern(f"{QUALIFIED[prefix]}{local_name}")
 
 
 def is_valid_namespace(uri: str) -> bool:
@@ -0,0 +1,145 @@
+import datetime
+import unittest
+from unittest.mock import patch
+
+from lxml import etree as ET
+
+from pyfactx.ExchangedDocument import ExchangedDocument
+from pyfactx.FacturXData import FacturXData
+from pyfactx.FacturXGenerator import FacturXGenerator
+from pyfactx.HeaderTradeAgreement import HeaderTradeAgreement
+from pyfactx.HeaderTradeDelivery import HeaderTradeDelivery
+from pyfactx.HeaderTradeSettlement import HeaderTradeSettlement
+from pyfactx.InvoiceProfile import InvoiceProfile
+from pyfactx.InvoiceTypeCode import InvoiceTypeCode
+from pyfactx.LegalOrganization import LegalOrganization
+from pyfactx.SupplyChainTradeTransaction import SupplyChainTradeTransaction
+from pyfactx.TradeAddress import TradeAddress
+from pyfactx.TradeParty import TradeParty
+from pyfactx.TradeSettlementHeaderMonetarySummation import TradeSettlementHeaderMonetarySummation
+from pyfactx.namespaces import RAM, get_qualified_name
+
+
+def make_minimum_invoice(
+        invoice_id: str = "2025-001",
+        delivery: HeaderTradeDelivery | None = None,
+        **settlement_fields
+) -> FacturXData:
+    """Builds an invoice holding only the fields required by the MINIMUM profile."""
+    transaction = SupplyChainTradeTransaction(
+        applicable_header_trade_agreement=HeaderTradeAgreement(
+            seller_trade_party=TradeParty(
+                name="Seller",
+                trade_address=TradeAddress(country="FR"),
+                specified_legal_organisation=LegalOrganization(id="123456789"),
+                specified_tax_registration="FR123456789"
+            ),
+            buyer_trade_party=TradeParty(name="Buyer")
+        ),
+        applicable_header_trade_delivery=delivery or HeaderTradeDelivery(),
+        applicable_header_trade_settlement=HeaderTradeSettlement(
+            invoice_currency_code="EUR",
+            specified_trade_settlement_header_monetary_summation=TradeSettlementHeaderMonetarySummation(
+                tax_basis_total_amount=100.0,
+                tax_total_amount=20.0,
+                tax_currency_code="EUR",
+                grand_total_amount=120.0,
+                due_payable_amount=120.0
+            ),
+            **settlement_fields
+        )
+    )
+    document = ExchangedDocument(
+        id=invoice_id,
+        type_code=InvoiceTypeCode.COMMERCIAL_INVOICE,
+        issue_date_time=datetime.datetime(2025, 4, 25)
+    )
+    return FacturXData.create(InvoiceProfile.MINIMUM, document, transaction)
+
+
+class GenerateManyTest(unittest.TestCase):
+
+    def test_extended_is_rejected_before_opening_saxon(self):
+        for validate_xslt in (True, False):
+            with self.subTest(validate_xslt=validate_xslt), \
+                    patch("pyfactx.FacturXGenerator.PySaxonProcessor") as processor:
+                with self.assertRaises(NotImplementedError):
+                    FacturXGenerator.generate_many(
+                        [make_minimum_invoice()],
+                        InvoiceProfile.EXTENDED,
+                        validate_xslt=validate_xslt
+                    )
+                processor.assert_not_called()
+
+    def test_extended_is_rejected_for_an_empty_batch(self):
+        with self.assertRaises(NotImplementedError):
+            FacturXGenerator.generate_many([], InvoiceProfile.EXTENDED)
+
+    def test_empty_batch(self):
+        for validate_xslt in (True, False):
+            with self.subTest(validate_xslt=validate_xslt):
+                self.assertEqual(
+                    FacturXGenerator.generate_many([], InvoiceProfile.MINIMUM, validate_xslt=validate_xslt),
+                    []
+                )
+
+    def test_batch_matches_generate_in_input_order(self):
+        invoices = [make_minimum_invoice("2025-001"), make_minimum_invoice("2025-002")]
+
+        results = FacturXGenerator.generate_many(invoices, InvoiceProfile.MINIMUM)
+
+        self.assertEqual(
+            [ET.tostring(xml) for xml in results],
+            [ET.tostring(FacturXGenerator.generate(invoice, InvoiceProfile.MINIMUM)) for invoice in invoices]
+        )
+
+
+class StrictProfileTest(unittest.TestCase):
+
+    def test_lenient_by_default_drops_fields_above_the_profile(self):
+        invoice = make_minimum_invoice(payment_reference="REF-1")
+
+        xml = FacturXGenerator.generate(invoice, InvoiceProfile.MINIMUM)
+
+        self.assertIsNone(xml.find(f".//{get_qualified_name(RAM, 'PaymentReference')}"))
+
+    def test_strict_accepts_an_invoice_that_fits_the_profile(self):
+        FacturXGenerator.generate(make_minimum_invoice(), InvoiceProfile.MINIMUM, strict_profile=True)
+
+    def test_strict_rejects_settlement_field_at_minimum(self):
+        invoice = make_minimum_invoice(payment_reference="REF-1")
+
+        with self.assertRaisesRegex(ValueError, "payment_reference"):
+            FacturXGenerator.generate(invoice, InvoiceProfile.MINIMUM, strict_profile=True)
+
+    def test_strict_rejects_delivery_field_at_minimum(self):
+        invoice = make_minimum_invoice(delivery=HeaderTradeDelivery(ship_to_trade_party=TradeParty(name="Ship-to")))
+
+        with self.assertRaisesRegex(ValueError, "BASICWL"):
+            FacturXGenerator.generate(invoice, InvoiceProfile.MINIMUM, validate_xslt=False, strict_profile=True)
+
+    def test_strict_rejects_missing_line_items_at_basic(self):
+        with self.assertRaisesRegex(ValueError, "Line items"):
+            FacturXGenerator.generate(
+                make_minimum_invoice(),
+                InvoiceProfile.BASIC,
+                validate_xslt=False,
+                strict_profile=True
+            )
+
+    def test_strict_applies_to_every_invoice_of_a_batch(self):
+        invoices = [make_minimum_invoice("2025-001"), make_minimum_invoice("2025-002", payment_reference="REF-2")]
+
+        for validate_xslt in (True, False):
+            with self.subTest(validate_xslt=validate_xslt):
+                with self.assertRaisesRegex(ValueError, "payment_reference"):
+                    FacturXGenerator.generate_many(
+                        invoices,
+                        InvoiceProfile.MINIMUM,
+                        validate_xslt=validate_xslt,
+                        strict_profile=True
+                    )
+
+
+if __name__ == "__main__":
+    unittest.main()
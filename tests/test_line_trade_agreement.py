@@ -0,0 +1,35 @@
+import unittest
+
+from pydantic import ValidationError
+
+from pyfactx.LineTradeAgreement import LineTradeAgreement
+from pyfactx.TradePrice import TradePrice
+
+
+class LineTradeAgreementPricesTest(unittest.TestCase):
+
+    def test_net_price_only(self):
+        agreement = LineTradeAgreement(net_price_product_trade_price=TradePrice(charge_amount=10.0))
+
+        self.assertIsNone(agreement.gross_price_product_trade_price)
+
+    def test_gross_price_above_or_equal_to_net_price(self):
+        for gross_amount in (12.0, 10.0):
+            with self.subTest(gross_amount=gross_amount):
+                agreement = LineTradeAgreement(
+                    gross_price_product_trade_price=TradePrice(charge_amount=gross_amount),
+                    net_price_product_trade_price=TradePrice(charge_amount=10.0)
+                )
+
+                self.assertEqual(agreement.gross_price_product_trade_price.charge_amount, gross_amount)
+
+    def test_gross_price_below_net_price_is_rejected(self):
+        with self.assertRaisesRegex(ValidationError, "Gross price cannot be less than net price"):
+            LineTradeAgreement(
+                gross_price_product_trade_price=TradePrice(charge_amount=9.99),
+                net_price_product_trade_price=TradePrice(charge_amount=10.0)
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()